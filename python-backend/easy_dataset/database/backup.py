@@ -11,7 +11,7 @@ import shutil
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +28,11 @@ class DatabaseBackup:
         """
         self.database_url = database_url
         self.database_path = self._extract_database_path(database_url)
+        # Filename -> backup-entry index, rebuilt only when the backup
+        # directory's mtime changes
+        self._index: dict = {}
+        self._index_dir: Optional[str] = None
+        self._index_mtime_ns: Optional[int] = None
     
     def _extract_database_path(self, database_url: str) -> str:
         """
@@ -337,73 +342,119 @@ class DatabaseBackup:
         name, ext = os.path.splitext(db_name)
         
         backups = []
-        for filename in os.listdir(backup_dir):
-            if filename.startswith(f"{name}_backup") and filename.endswith(ext):
-                backup_path = os.path.join(backup_dir, filename)
-                backups.append({
-                    "path": backup_path,
-                    "filename": filename,
-                    "size_bytes": os.path.getsize(backup_path),
-                    "created": datetime.fromtimestamp(
-                        os.path.getctime(backup_path)
-                    ).isoformat()
-                })
-        
+        # scandir folds the stat into the directory read (one syscall
+        # per entry instead of listdir + getsize + getctime)
+        prefix = f"{name}_backup"
+        with os.scandir(backup_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                if filename.startswith(prefix) and filename.endswith(ext):
+                    stat_result = entry.stat()
+                    backups.append({
+                        "path": entry.path,
+                        "filename": filename,
+                        "size_bytes": stat_result.st_size,
+                        "created": datetime.fromtimestamp(
+                            stat_result.st_ctime
+                        ).isoformat()
+                    })
+
         # Sort by creation time (newest first)
         backups.sort(key=lambda x: x["created"], reverse=True)
-        
+
         return backups
 
+    def get_backup(
+        self, filename: str, backup_dir: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        Look up a single backup by filename.
+
+        Keeps a filename-keyed index guarded by the backup directory's
+        mtime, so repeated lookups are a dict access rather than a full
+        directory re-listing and linear scan.
+
+        Args:
+            filename: Backup filename to look up
+            backup_dir: Directory to search for backups (optional)
+
+        Returns:
+            Backup entry dict (same shape as list_backups items), or
+            None if no such backup exists
+        """
+        if backup_dir is None:
+            backup_dir = os.path.dirname(self.database_path)
+
+        try:
+            mtime_ns = os.stat(backup_dir).st_mtime_ns
+        except OSError:
+            return None
+
+        if backup_dir != self._index_dir or mtime_ns != self._index_mtime_ns:
+            self._index = {
+                b["filename"]: b for b in self.list_backups(backup_dir)
+            }
+            self._index_dir = backup_dir
+            self._index_mtime_ns = mtime_ns
+
+        return self._index.get(filename)
+
 
-def create_backup(database_url: str, backup_path: Optional[str] = None) -> str:
+def create_backup(
+    database_url: str,
+    backup_path: Optional[str] = None
+) -> Tuple[str, int]:
     """
     Convenience function to create a database backup.
-    
+
     Args:
         database_url: SQLAlchemy database URL
         backup_path: Path for backup file (optional)
-    
+
     Returns:
-        Path to backup file
+        Tuple of (path to backup file, size in bytes)
     """
     backup_manager = DatabaseBackup(database_url)
-    return backup_manager.backup(backup_path)
+    path = backup_manager.backup(backup_path)
+    return path, os.stat(path).st_size
 
 
 def create_optimized_backup(
     database_url: str,
     backup_path: Optional[str] = None
-) -> str:
+) -> Tuple[str, int]:
     """
     Convenience function to create an optimized database backup.
-    
+
     Args:
         database_url: SQLAlchemy database URL
         backup_path: Path for backup file (optional)
-    
+
     Returns:
-        Path to backup file
+        Tuple of (path to backup file, size in bytes)
     """
     backup_manager = DatabaseBackup(database_url)
-    return backup_manager.backup_with_vacuum(backup_path)
+    path = backup_manager.backup_with_vacuum(backup_path)
+    return path, os.stat(path).st_size
 
 
 def export_database_sql(
     database_url: str,
     export_path: Optional[str] = None
-) -> str:
+) -> Tuple[str, int]:
     """
     Convenience function to export database as SQL.
-    
+
     Args:
         database_url: SQLAlchemy database URL
         export_path: Path for SQL dump file (optional)
-    
+
     Returns:
-        Path to SQL dump file
+        Tuple of (path to SQL dump file, size in bytes)
     """
     backup_manager = DatabaseBackup(database_url)
-    return backup_manager.export_sql(export_path)
+    path = backup_manager.export_sql(export_path)
+    return path, os.stat(path).st_size
 
 
 def get_database_info(database_url: str) -> dict:
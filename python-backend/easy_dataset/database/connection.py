@@ -41,11 +41,30 @@ def get_engine(database_url: str | None = None) -> Engine:
     if database_url in _engines:
         return _engines[database_url]
     
+    # Pool tuning for network databases: keep warm connections around
+    # so concurrent requests reuse them instead of paying a TCP+auth
+    # handshake each, pre-ping to evict dead connections, and recycle
+    # hourly to stay ahead of server-side idle timeouts. SQLite is
+    # in-process, so its default pooling is left alone
+    pool_kwargs = {}
+    if not database_url.startswith("sqlite"):
+        pool_kwargs = {
+            "pool_size": 20,
+            "max_overflow": 10,
+            "pool_timeout": 30,
+            "pool_pre_ping": True,
+            "pool_recycle": 3600,
+        }
+
     # Create engine with proper SQLite settings
     engine = create_engine(
         database_url,
         echo=False,  # Set to True for SQL query logging
         connect_args={"check_same_thread": False} if database_url.startswith("sqlite") else {},
+        # Batch multi-row INSERTs into pages of 1000 rows so bulk ingest
+        # (e.g. chunk storage) issues one multi-values statement per page
+        insertmanyvalues_page_size=1000,
+        **pool_kwargs,
     )
     
     # Enable foreign keys for SQLite
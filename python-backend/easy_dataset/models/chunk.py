@@ -40,7 +40,12 @@ class Chunks(Base):
     """
     
     __tablename__ = "chunks"
-    
+    __table_args__ = (
+        # Composite index backing the list_chunks filters so combined
+        # project/file lookups resolve with a single index scan
+        Index("idx_chunks_project_file", "project_id", "file_id"),
+    )
+
     # Primary key
     id: Mapped[str] = mapped_column(
         String,
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from nanoid import generate
-from sqlalchemy import String, Text, Float, Boolean, DateTime, ForeignKey
+from sqlalchemy import String, Text, Float, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from easy_dataset.database.base import Base
@@ -46,6 +46,17 @@ class Datasets(Base):
     """
     
     __tablename__ = "datasets"
+    __table_args__ = (
+        # Composite index backing the list_datasets filter combination
+        # (project scope, confirmation state, score threshold) so
+        # filtered listings resolve with one index scan
+        Index(
+            "ix_datasets_project_confirmed_score",
+            "project_id",
+            "confirmed",
+            "score",
+        ),
+    )
     
     # Primary key
     id: Mapped[str] = mapped_column(
@@ -50,7 +50,8 @@ class UploadFiles(Base):
     project_id: Mapped[str] = mapped_column(
         String,
         ForeignKey("projects.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
     
     # File metadata
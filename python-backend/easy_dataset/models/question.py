@@ -43,7 +43,21 @@ class Questions(Base):
     """
     
     __tablename__ = "questions"
-    
+    __table_args__ = (
+        # Composite indexes backing the list_questions filter
+        # combinations; the trailing (create_at, id) columns match the
+        # keyset ordering so a page resolves from one index scan
+        # without a re-sort
+        Index(
+            "ix_questions_project_answered_create",
+            "project_id",
+            "answered",
+            "create_at",
+            "id",
+        ),
+        Index("ix_questions_chunk_create", "chunk_id", "create_at", "id"),
+    )
+
     # Primary key
     id: Mapped[str] = mapped_column(
         String,
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 
 class ChunkBase(BaseModel):
@@ -17,11 +17,23 @@ class ChunkBase(BaseModel):
 
 class ChunkCreate(ChunkBase):
     """Schema for creating a new chunk."""
-    
+
+    size: int = Field(
+        default=0,
+        ge=0,
+        description="Size of the chunk in characters (computed from content when omitted)",
+    )
     project_id: str = Field(..., description="ID of the project this chunk belongs to")
     file_id: str = Field(..., description="ID of the source file")
     file_name: str = Field(..., description="Name of the source file")
 
+    @model_validator(mode="after")
+    def _default_size(self) -> "ChunkCreate":
+        """Capture len(content) once at validation when size is omitted."""
+        if self.size <= 0:
+            self.size = len(self.content)
+        return self
+
 
 class ChunkUpdate(BaseModel):
     """Schema for updating an existing chunk."""
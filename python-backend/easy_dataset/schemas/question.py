@@ -8,7 +8,12 @@ from pydantic import BaseModel, Field, ConfigDict
 
 class QuestionBase(BaseModel):
     """Base schema for Question with common fields."""
-    
+
+    # Question payloads arrive in bulk (batch create, list pages) with
+    # the same keys and label values repeated row after row; interning
+    # those strings during parsing cuts per-row allocations
+    model_config = ConfigDict(cache_strings=True)
+
     question: str = Field(..., min_length=1, description="The question text")
     label: str = Field(..., description="Question label/category")
 
@@ -27,7 +32,9 @@ class QuestionCreate(QuestionBase):
 
 class QuestionUpdate(BaseModel):
     """Schema for updating an existing question."""
-    
+
+    model_config = ConfigDict(cache_strings=True)
+
     question: Optional[str] = Field(None, min_length=1, description="The question text")
     label: Optional[str] = Field(None, description="Question label/category")
     answered: Optional[bool] = Field(None, description="Whether this question has been answered")
@@ -322,14 +322,14 @@ class ImageService:
         
         # Delete file from storage
         try:
+            # missing_ok folds the exists() probe into the unlink itself:
+            # one syscall instead of two and no TOCTOU window
             file_path = self.storage_path / image.path
-            if file_path.exists():
-                file_path.unlink()
-                
-                # Delete thumbnail if exists
-                thumb_path = file_path.parent / f"thumb_{file_path.name}"
-                if thumb_path.exists():
-                    thumb_path.unlink()
+            file_path.unlink(missing_ok=True)
+
+            # Delete thumbnail if exists
+            thumb_path = file_path.parent / f"thumb_{file_path.name}"
+            thumb_path.unlink(missing_ok=True)
         except Exception as e:
             logger.warning(f"Failed to delete image file: {e}")
         
@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import logging
 from datetime import datetime
 from typing import Optional, Dict, Any, List, Callable
 from sqlalchemy.orm import Session
@@ -10,6 +11,29 @@ from sqlalchemy import select
 from easy_dataset.models.task import Task
 from easy_dataset.schemas.task import TaskStatus, TaskCreate, TaskUpdate
 
+logger = logging.getLogger(__name__)
+
+# Callbacks invoked with the task id whenever a task's progress or
+# status is recorded. The websocket layer registers its change-event
+# signaler here, so progress subscribers wake on writes without the
+# service layer importing server code. Tasks run on the server's event
+# loop (start_task_async), so listeners are called in loop context
+_task_change_listeners: List[Callable[[str], None]] = []
+
+
+def register_task_change_listener(listener: Callable[[str], None]) -> None:
+    """Register a callback to be invoked on every task change."""
+    _task_change_listeners.append(listener)
+
+
+def _notify_task_change(task_id: str) -> None:
+    """Invoke registered listeners for a changed task."""
+    for listener in _task_change_listeners:
+        try:
+            listener(task_id)
+        except Exception as e:
+            logger.error(f"Task change listener failed for {task_id}: {e}")
+
 
 class TaskService:
     """
@@ -153,10 +177,11 @@ class TaskService:
         if note:
             task.note = note
         task.update_at = datetime.utcnow()
-        
+
         self.db.commit()
         self.db.refresh(task)
-        
+
+        _notify_task_change(task_id)
         return task
     
     def complete_task(
@@ -183,14 +208,15 @@ class TaskService:
         if note:
             task.note = note
         task.update_at = datetime.utcnow()
-        
+
         self.db.commit()
         self.db.refresh(task)
-        
+
         # Remove from running tasks
         if task_id in self._running_tasks:
             del self._running_tasks[task_id]
-        
+
+        _notify_task_change(task_id)
         return task
     
     def fail_task(
@@ -216,14 +242,15 @@ class TaskService:
         task.end_time = datetime.utcnow()
         task.note = error_message
         task.update_at = datetime.utcnow()
-        
+
         self.db.commit()
         self.db.refresh(task)
-        
+
         # Remove from running tasks
         if task_id in self._running_tasks:
             del self._running_tasks[task_id]
-        
+
+        _notify_task_change(task_id)
         return task
     
     def cancel_task(self, task_id: str) -> Optional[Task]:
@@ -251,10 +278,11 @@ class TaskService:
         task.end_time = datetime.utcnow()
         task.note = "Task canceled by user"
         task.update_at = datetime.utcnow()
-        
+
         self.db.commit()
         self.db.refresh(task)
-        
+
+        _notify_task_change(task_id)
         return task
     
     async def run_task_async(
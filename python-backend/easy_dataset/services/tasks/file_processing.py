@@ -3,10 +3,11 @@
 import json
 from pathlib import Path
 from typing import Dict, Any
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from easy_dataset.core.file_processor import get_registry, FileStorageUtil
-from easy_dataset.core.text_splitter import TextSplitter
+from easy_dataset.core.text_splitter import TextChunk, TextSplitter
 from easy_dataset.models.file import UploadFiles
 from easy_dataset.models.chunk import Chunks
 from easy_dataset.services.task_service import TaskService
@@ -85,7 +86,15 @@ async def process_file_task(
                 chunk_size=chunk_size,
                 overlap=overlap
             )
-        
+
+        # The markdown strategy yields TextChunk objects; the delimiter
+        # and overlap strategies yield bare strings. Normalize here once
+        # so the row build below stays branch-free per chunk
+        chunks = [
+            c if isinstance(c, TextChunk) else TextChunk(content=c)
+            for c in chunks
+        ]
+
         # Update total count now that we know how many chunks
         task = task_service.get_task(task_id)
         if task:
@@ -99,27 +108,37 @@ async def process_file_task(
             note=f"Storing {len(chunks)} chunks..."
         )
         
-        for idx, chunk in enumerate(chunks):
-            # Create chunk record
-            chunk_record = Chunks(
-                project_id=project_id,
-                file_id=file_id,
-                content=chunk.content if hasattr(chunk, 'content') else str(chunk),
-                summary=chunk.summary if hasattr(chunk, 'summary') else "",
-                size=chunk.size if hasattr(chunk, 'size') else len(str(chunk)),
-                index=idx
+        # Chunk names come from the split's section title when one
+        # exists, falling back to the file name plus ordinal
+        file_name = db.execute(
+            select(UploadFiles.file_name).where(UploadFiles.id == file_id)
+        ).scalar_one_or_none() or file_path_obj.name
+
+        # Build all rows up front and insert them via SQLAlchemy Core so the
+        # dialect emits one multi-values INSERT per insertmanyvalues page
+        # instead of a round-trip per chunk. Chunks are normalized to
+        # TextChunk above, so no hasattr/str() fallbacks are needed here
+        rows = [
+            {
+                "project_id": project_id,
+                "file_id": file_id,
+                "file_name": file_name,
+                "name": chunk.title or f"{file_name}-part-{idx + 1}",
+                "content": chunk.content,
+                "summary": chunk.summary,
+                "size": chunk.size,
+            }
+            for idx, chunk in enumerate(chunks)
+        ]
+
+        if rows:
+            db.execute(insert(Chunks), rows)
+            task_service.update_task_progress(
+                task_id,
+                completed_count=2 + len(chunks),
+                note=f"Stored {len(chunks)}/{len(chunks)} chunks"
             )
-            db.add(chunk_record)
-            
-            # Update progress periodically
-            if (idx + 1) % 10 == 0 or idx == len(chunks) - 1:
-                task_service.update_task_progress(
-                    task_id,
-                    completed_count=2 + idx + 1,
-                    note=f"Stored {idx + 1}/{len(chunks)} chunks"
-                )
-                db.commit()
-        
+
         # Final commit
         db.commit()
         
@@ -14,6 +14,43 @@ from easy_dataset.services.image_service import ImageService
 
 logger = logging.getLogger(__name__)
 
+# Default prompt templates per language, built once at import time so
+# concurrent tasks don't rebuild the dict for every image
+_DEFAULT_TEMPLATES = {
+    "en": """Analyze this image and generate {num_questions} thoughtful questions about it.
+
+The questions should:
+- Be specific to what you see in the image
+- Cover different aspects (objects, actions, context, details)
+- Be answerable based on the image content
+- Vary in complexity
+
+Format your response as a JSON array of questions:
+["Question 1?", "Question 2?", "Question 3?"]""",
+
+    "zh-CN": """分析这张图片并生成 {num_questions} 个有深度的问题。
+
+问题应该：
+- 针对图片中看到的内容
+- 涵盖不同方面（物体、动作、背景、细节）
+- 基于图片内容可以回答
+- 难度各异
+
+将回答格式化为 JSON 数组：
+["问题 1？", "问题 2？", "问题 3？"]""",
+
+    "tr": """Bu görseli analiz edin ve {num_questions} düşündürücü soru oluşturun.
+
+Sorular şunları içermelidir:
+- Görselde gördüklerinize özgü olmalı
+- Farklı yönleri kapsamalı (nesneler, eylemler, bağlam, detaylar)
+- Görsel içeriğe dayanarak cevaplanabilir olmalı
+- Karmaşıklık açısından çeşitlilik göstermeli
+
+Yanıtınızı JSON dizisi olarak biçimlendirin:
+["Soru 1?", "Soru 2?", "Soru 3?"]"""
+}
+
 
 class ImageQuestionGenerationTask:
     """
@@ -54,42 +91,7 @@ class ImageQuestionGenerationTask:
         Returns:
             Prompt template string
         """
-        templates = {
-            "en": """Analyze this image and generate {num_questions} thoughtful questions about it.
-
-The questions should:
-- Be specific to what you see in the image
-- Cover different aspects (objects, actions, context, details)
-- Be answerable based on the image content
-- Vary in complexity
-
-Format your response as a JSON array of questions:
-["Question 1?", "Question 2?", "Question 3?"]""",
-            
-            "zh-CN": """分析这张图片并生成 {num_questions} 个有深度的问题。
-
-问题应该：
-- 针对图片中看到的内容
-- 涵盖不同方面（物体、动作、背景、细节）
-- 基于图片内容可以回答
-- 难度各异
-
-将回答格式化为 JSON 数组：
-["问题 1？", "问题 2？", "问题 3？"]""",
-            
-            "tr": """Bu görseli analiz edin ve {num_questions} düşündürücü soru oluşturun.
-
-Sorular şunları içermelidir:
-- Görselde gördüklerinize özgü olmalı
-- Farklı yönleri kapsamalı (nesneler, eylemler, bağlam, detaylar)
-- Görsel içeriğe dayanarak cevaplanabilir olmalı
-- Karmaşıklık açısından çeşitlilik göstermeli
-
-Yanıtınızı JSON dizisi olarak biçimlendirin:
-["Soru 1?", "Soru 2?", "Soru 3?"]"""
-        }
-        
-        return templates.get(language, templates["en"])
+        return _DEFAULT_TEMPLATES.get(language, _DEFAULT_TEMPLATES["en"])
     
     def validate_vision_model(self, model_name: str) -> bool:
         """
@@ -128,18 +130,22 @@ Yanıtınızı JSON dizisi olarak biçimlendirin:
         config: Dict[str, Any],
         num_questions: int = 3,
         custom_prompt: Optional[str] = None,
-        language: str = "en"
+        language: str = "en",
+        prompt: Optional[str] = None
     ) -> List[str]:
         """
         Generate questions for a single image.
-        
+
         Args:
             image: Images model instance
             config: LLM provider configuration
             num_questions: Number of questions to generate
             custom_prompt: Optional custom prompt template
             language: Language code
-            
+            prompt: Pre-formatted prompt. If provided, skips template
+                lookup and formatting (useful when the same prompt is
+                shared across a batch of images)
+
         Returns:
             List of generated questions
             
@@ -161,13 +167,10 @@ Yanıtınızı JSON dizisi olarak biçimlendirin:
         if not image_data_url:
             raise RuntimeError(f"Failed to load image data for image {image.id}")
         
-        # Prepare prompt
-        if custom_prompt:
-            prompt = custom_prompt.format(num_questions=num_questions)
-        else:
-            prompt = self.get_default_prompt_template(language).format(
-                num_questions=num_questions
-            )
+        # Prepare prompt (skipped when a pre-formatted one is supplied)
+        if prompt is None:
+            template = custom_prompt or self.get_default_prompt_template(language)
+            prompt = template.format(num_questions=num_questions)
         
         # Call vision API
         try:
@@ -241,6 +244,12 @@ Yanıtınızı JSON dizisi olarak biçimlendirin:
         task.status = TaskStatus.PROCESSING
         self.db.commit()
         
+        # Format the prompt once; num_questions is constant across the batch
+        # so every worker can share the same string
+        prompt = (
+            custom_prompt or _DEFAULT_TEMPLATES.get(language, _DEFAULT_TEMPLATES["en"])
+        ).format(num_questions=num_questions)
+
         # Process images
         processed = 0
         failed = 0
@@ -268,7 +277,8 @@ Yanıtınızı JSON dizisi olarak biçimlendirin:
                         config=llm_config,
                         num_questions=num_questions,
                         custom_prompt=custom_prompt,
-                        language=language
+                        language=language,
+                        prompt=prompt
                     )
                     
                     # Store questions in database
@@ -11,6 +11,37 @@ from easy_dataset.models.chunk import Chunks
 from easy_dataset.models.question import Questions
 from easy_dataset.services.task_service import TaskService
 
+# Reusable decoder so raw_decode can parse an embedded array in place
+# without slicing the content string first
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json_array(content: str) -> Optional[List[Any]]:
+    """
+    Locate and parse the first JSON array embedded in LLM output.
+
+    Handles plain arrays, arrays preceded by prose, and arrays inside
+    markdown code fences in a single scan: raw_decode parses the value
+    starting at each ``[`` candidate and ignores any trailing text
+    (closing fences, explanations), so no fence-stripping passes are
+    needed.
+
+    Args:
+        content: Raw LLM response content
+
+    Returns:
+        The parsed list, or None if no valid JSON array was found
+    """
+    start = content.find('[')
+    while start != -1:
+        try:
+            value, _ = _JSON_DECODER.raw_decode(content, start)
+        except json.JSONDecodeError:
+            start = content.find('[', start + 1)
+            continue
+        return value if isinstance(value, list) else None
+    return None
+
 
 async def generate_questions_for_chunk(
     llm_service: LLMService,
@@ -49,39 +80,28 @@ async def generate_questions_for_chunk(
     messages = [{"role": "user", "content": prompt}]
     response = await provider.chat(messages)
     
-    # Parse response - expecting JSON array of questions
+    # Parse response - expecting JSON array of questions, possibly
+    # wrapped in markdown fences or surrounded by prose
     content = response.get('content', '[]')
-    
-    # Try to extract JSON from markdown code blocks if present
-    if '```json' in content:
-        start = content.find('```json') + 7
-        end = content.find('```', start)
-        content = content[start:end].strip()
-    elif '```' in content:
-        start = content.find('```') + 3
-        end = content.find('```', start)
-        content = content[start:end].strip()
-    
-    try:
-        questions = json.loads(content)
-        if isinstance(questions, list):
-            return [str(q) for q in questions if q]
-        return []
-    except json.JSONDecodeError:
-        # If JSON parsing fails, try to extract questions line by line
-        lines = content.strip().split('\n')
-        questions = []
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith('#') and not line.startswith('//'):
-                # Remove common prefixes
-                for prefix in ['- ', '* ', '1. ', '2. ', '3. ', '4. ', '5. ']:
-                    if line.startswith(prefix):
-                        line = line[len(prefix):].strip()
-                        break
-                if line:
-                    questions.append(line)
-        return questions
+
+    parsed = _extract_json_array(content)
+    if parsed is not None:
+        return [str(q) for q in parsed if q]
+
+    # If no JSON array found, try to extract questions line by line
+    lines = content.strip().split('\n')
+    questions = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith(('#', '//', '```')):
+            # Remove common prefixes
+            for prefix in ['- ', '* ', '1. ', '2. ', '3. ', '4. ', '5. ']:
+                if line.startswith(prefix):
+                    line = line[len(prefix):].strip()
+                    break
+            if line:
+                questions.append(line)
+    return questions
 
 
 async def process_question_generation_task(
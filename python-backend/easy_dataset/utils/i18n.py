@@ -7,9 +7,92 @@ functionality for the Easy Dataset application.
 
 import json
 import os
+import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Any
-from threading import Lock
+from typing import Dict, Optional, Any, Tuple
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# Matches both {{var}} and {var} interpolation placeholders so a single
+# regex pass can substitute all variables at once
+_INTERP_RE = re.compile(r'\{\{(\w+)\}\}|\{(\w+)\}')
+
+
+@lru_cache(maxsize=8192)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """
+    Split a dotted translation key, caching the result.
+
+    High-frequency keys are split once and the same tuple is reused on
+    subsequent calls, avoiding a list allocation per call.
+
+    Args:
+        key: Translation key in dot notation
+
+    Returns:
+        Tuple of key segments
+    """
+    return tuple(key.split('.'))
+
+
+@lru_cache(maxsize=256)
+def _detect(accept_language: str, supported: Tuple[str, ...], default: str) -> str:
+    """
+    Parse an Accept-Language header and pick the best supported language.
+
+    Cached because web clients send a small set of distinct headers, so
+    repeat requests resolve with a single dict lookup instead of
+    re-parsing and re-sorting the header every time.
+
+    Args:
+        accept_language: Accept-Language header value
+        supported: Supported language codes (tuple, for hashability)
+        default: Default language code
+
+    Returns:
+        Best matching supported language code
+    """
+    # Parse Accept-Language header
+    # Format: "en-US,en;q=0.9,zh-CN;q=0.8"
+    languages = []
+    for lang_part in accept_language.split(','):
+        # partition() finds the separator in one scan and avoids the
+        # per-token list allocations of split()
+        lang, sep, rest = lang_part.partition(';')
+        if sep:
+            _, _, qstr = rest.partition('=')
+            try:
+                q = float(qstr)
+            except ValueError:
+                q = 1.0
+        else:
+            q = 1.0
+
+        languages.append((lang.strip(), q))
+
+    # Sort by quality
+    languages.sort(key=lambda x: x[1], reverse=True)
+
+    # Find first supported language
+    for lang, _ in languages:
+        # Try exact match first
+        if lang in supported:
+            return lang
+
+        # Try language without region (e.g., 'zh' from 'zh-CN')
+        base_lang = lang.split('-')[0]
+        for supported_lang in supported:
+            if supported_lang.startswith(base_lang):
+                return supported_lang
+
+    return default
 
 
 class I18n:
@@ -17,32 +100,40 @@ class I18n:
     Internationalization manager for Easy Dataset.
     
     Supports multiple languages with JSON-based translation files.
-    Thread-safe singleton implementation.
+    Singleton, bootstrapped once at module import (under the import
+    lock), so later I18n() calls are a single attribute check.
     """
     
     _instance: Optional['I18n'] = None
-    _lock: Lock = Lock()
+    # Resolved locales directory, cached at class level since it never
+    # moves during the process lifetime
+    _cached_locales_dir: Optional[Path] = None
     
-    # Supported languages
-    SUPPORTED_LANGUAGES = ['en', 'zh-CN', 'tr']
+    # Supported languages (tuple for ordered iteration, frozenset for
+    # O(1) membership tests)
+    SUPPORTED_LANGUAGES = ('en', 'zh-CN', 'tr')
+    _SUPPORTED_SET = frozenset(SUPPORTED_LANGUAGES)
     DEFAULT_LANGUAGE = 'en'
     
     def __new__(cls):
-        """Ensure singleton pattern."""
+        """Return the singleton instance, allocating it on first use."""
         if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
+            cls._instance = super().__new__(cls)
+            cls._instance._bootstrap()
         return cls._instance
-    
+
     def __init__(self):
-        """Initialize the i18n manager."""
-        if not hasattr(self, '_initialized'):
-            self._translations: Dict[str, Dict[str, Any]] = {}
-            self._current_language: str = self.DEFAULT_LANGUAGE
-            self._locales_dir: Optional[Path] = None
-            self._initialized = True
-            self._load_translations()
+        """No-op: the singleton is bootstrapped once in __new__."""
+
+    def _bootstrap(self):
+        """Initialize the i18n manager (runs once, at first construction)."""
+        self._translations: Dict[str, Dict[str, Any]] = {}
+        # Flat dotted-key lookup maps, derived from the nested
+        # dicts so translate() is a single dict access
+        self._flat: Dict[str, Dict[str, str]] = {}
+        self._current_language: str = self.DEFAULT_LANGUAGE
+        self._locales_dir: Optional[Path] = None
+        self._load_translations()
     
     def _find_locales_directory(self) -> Path:
         """
@@ -59,45 +150,108 @@ class I18n:
         Raises:
             FileNotFoundError: If locales directory cannot be found
         """
+        # Return the cached directory from a previous resolution
+        if I18n._cached_locales_dir is not None:
+            return I18n._cached_locales_dir
+
         # Get the package root directory
         package_root = Path(__file__).parent.parent.parent
-        
+
         # Try multiple possible locations
         possible_locations = [
             package_root / 'locales',  # python-backend/locales
             Path.cwd() / 'locales',     # Current working directory
             package_root.parent / 'locales',  # Parent directory (for development)
         ]
-        
+
         for location in possible_locations:
-            if location.exists() and location.is_dir():
+            # Single stat per candidate instead of exists() + is_dir()
+            try:
+                st = os.stat(location)
+            except OSError:
+                continue
+            if stat.S_ISDIR(st.st_mode):
+                I18n._cached_locales_dir = location
                 return location
-        
+
         # If not found, create default location
         default_location = package_root / 'locales'
         default_location.mkdir(parents=True, exist_ok=True)
+        I18n._cached_locales_dir = default_location
         return default_location
     
+    @staticmethod
+    def _flatten(nested: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Flatten a nested translation dict into dotted-key form.
+
+        Args:
+            nested: Nested translation dict (e.g., {'common': {'save': 'Save'}})
+
+        Returns:
+            Flat dict keyed by dot notation (e.g., {'common.save': 'Save'})
+        """
+        flat: Dict[str, str] = {}
+        stack = [('', nested)]
+        while stack:
+            prefix, current = stack.pop()
+            for k, v in current.items():
+                dotted = f'{prefix}.{k}' if prefix else k
+                if isinstance(v, dict):
+                    stack.append((dotted, v))
+                elif isinstance(v, str):
+                    flat[dotted] = v
+        return flat
+
+    def _load_one(self, lang: str) -> Dict[str, Any]:
+        """
+        Load the translation file for a single language.
+
+        Args:
+            lang: Language code
+
+        Returns:
+            Parsed translation dict, or an empty dict if the file
+            doesn't exist
+        """
+        translation_file = self._locales_dir / lang / 'messages.json'
+
+        try:
+            # orjson parses raw bytes directly (no text-mode decode
+            # step), which speeds up startup and reload_translations()
+            # considerably
+            data = translation_file.read_bytes()
+        except FileNotFoundError:
+            # Create empty translation dict if file doesn't exist
+            return {}
+
+        if _HAS_ORJSON:
+            return orjson.loads(data)
+        return json.loads(data)
+
     def _load_translations(self):
         """Load all translation files from the locales directory."""
         try:
             self._locales_dir = self._find_locales_directory()
-            
-            for lang in self.SUPPORTED_LANGUAGES:
-                translation_file = self._locales_dir / lang / 'messages.json'
-                
-                if translation_file.exists():
-                    with open(translation_file, 'r', encoding='utf-8') as f:
-                        self._translations[lang] = json.load(f)
-                else:
-                    # Create empty translation dict if file doesn't exist
-                    self._translations[lang] = {}
-                    
+
+            # Read the per-language files concurrently; the reads are
+            # I/O-bound and release the GIL, so startup pays roughly the
+            # cost of the slowest file instead of the sum
+            with ThreadPoolExecutor(
+                max_workers=len(self.SUPPORTED_LANGUAGES)
+            ) as executor:
+                loaded = executor.map(self._load_one, self.SUPPORTED_LANGUAGES)
+
+            for lang, translations in zip(self.SUPPORTED_LANGUAGES, loaded):
+                self._translations[lang] = translations
+                self._flat[lang] = self._flatten(translations)
+
         except Exception as e:
             print(f"Warning: Failed to load translations: {e}")
             # Initialize with empty translations
             for lang in self.SUPPORTED_LANGUAGES:
                 self._translations[lang] = {}
+                self._flat[lang] = {}
     
     def set_language(self, language: str) -> bool:
         """
@@ -109,7 +263,7 @@ class I18n:
         Returns:
             True if language was set successfully, False otherwise
         """
-        if language in self.SUPPORTED_LANGUAGES:
+        if language in self._SUPPORTED_SET:
             self._current_language = language
             return True
         return False
@@ -123,14 +277,16 @@ class I18n:
         """
         return self._current_language
     
-    def get_supported_languages(self) -> list:
+    def get_supported_languages(self) -> Tuple[str, ...]:
         """
-        Get list of supported languages.
-        
+        Get the supported languages.
+
         Returns:
-            List of supported language codes
+            Tuple of supported language codes. The tuple is shared and
+            immutable; callers that need a mutable copy should wrap it
+            in list()
         """
-        return self.SUPPORTED_LANGUAGES.copy()
+        return self.SUPPORTED_LANGUAGES
     
     def translate(self, key: str, language: Optional[str] = None, **kwargs) -> str:
         """
@@ -145,41 +301,31 @@ class I18n:
             Translated string, or the key itself if translation not found
         """
         lang = language or self._current_language
-        
-        # Get translation dict for language
-        translations = self._translations.get(lang, {})
-        
-        # Navigate through nested dict using dot notation
-        keys = key.split('.')
-        value = translations
-        
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    # Fallback to English if translation not found
-                    if lang != self.DEFAULT_LANGUAGE:
-                        return self.translate(key, self.DEFAULT_LANGUAGE, **kwargs)
-                    return key
-            else:
-                return key
-        
-        # If value is not a string, return the key
-        if not isinstance(value, str):
+
+        # Single dict lookup against the pre-flattened dotted-key map
+        value = self._flat.get(lang, {}).get(key)
+
+        if value is None:
+            # Fallback to English if translation not found
+            if lang != self.DEFAULT_LANGUAGE:
+                return self.translate(key, self.DEFAULT_LANGUAGE, **kwargs)
             return key
-        
+
         # Perform string interpolation if kwargs provided
         if kwargs:
             try:
-                # Support both {{var}} and {var} syntax
-                result = value
-                for var_key, var_value in kwargs.items():
-                    result = result.replace(f'{{{{{var_key}}}}}', str(var_value))
-                    result = result.replace(f'{{{var_key}}}', str(var_value))
-                return result
+                # Substitute {{var}} and {var} placeholders in one scan;
+                # unknown placeholders are left untouched
+                def _replace(match: 're.Match') -> str:
+                    name = match.group(1) or match.group(2)
+                    if name in kwargs:
+                        return str(kwargs[name])
+                    return match.group(0)
+
+                return _INTERP_RE.sub(_replace, value)
             except Exception:
                 return value
-        
+
         return value
     
     def t(self, key: str, **kwargs) -> str:
@@ -207,40 +353,24 @@ class I18n:
         """
         if not accept_language:
             return self.DEFAULT_LANGUAGE
-        
-        # Parse Accept-Language header
-        # Format: "en-US,en;q=0.9,zh-CN;q=0.8"
-        languages = []
-        for lang_part in accept_language.split(','):
-            lang_part = lang_part.strip()
-            if ';' in lang_part:
-                lang, quality = lang_part.split(';', 1)
-                try:
-                    q = float(quality.split('=')[1])
-                except (IndexError, ValueError):
-                    q = 1.0
-            else:
-                lang = lang_part
-                q = 1.0
-            
-            languages.append((lang.strip(), q))
-        
-        # Sort by quality
-        languages.sort(key=lambda x: x[1], reverse=True)
-        
-        # Find first supported language
-        for lang, _ in languages:
-            # Try exact match first
-            if lang in self.SUPPORTED_LANGUAGES:
-                return lang
-            
-            # Try language without region (e.g., 'zh' from 'zh-CN')
-            base_lang = lang.split('-')[0]
+
+        # Fast path: browsers send the header sorted, so a first token
+        # without an explicit q-value (implying q=1.0, the maximum) can
+        # be matched without the full parse-and-sort
+        first = accept_language.split(',', 1)[0].strip()
+        if ';' not in first:
+            if first in self._SUPPORTED_SET:
+                return first
+            base = first.split('-')[0]
             for supported in self.SUPPORTED_LANGUAGES:
-                if supported.startswith(base_lang):
+                if supported.startswith(base):
                     return supported
-        
-        return self.DEFAULT_LANGUAGE
+
+        return _detect(
+            accept_language,
+            tuple(self.SUPPORTED_LANGUAGES),
+            self.DEFAULT_LANGUAGE
+        )
     
     def add_translation(self, language: str, key: str, value: str):
         """
@@ -253,21 +383,25 @@ class I18n:
         """
         if language not in self._translations:
             self._translations[language] = {}
-        
+
         # Navigate and create nested structure
-        keys = key.split('.')
+        keys = _split_key(key)
         current = self._translations[language]
-        
+
         for k in keys[:-1]:
             if k not in current:
                 current[k] = {}
             current = current[k]
-        
+
         current[keys[-1]] = value
+
+        # Keep the flat lookup map in sync
+        self._flat.setdefault(language, {})[key] = value
     
     def reload_translations(self):
         """Reload all translation files from disk."""
         self._translations.clear()
+        self._flat.clear()
         self._load_translations()
 
 
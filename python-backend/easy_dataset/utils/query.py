@@ -5,24 +5,73 @@ This module provides utilities for building database queries with
 filtering, pagination, and sorting capabilities.
 """
 
+import base64
 import logging
-from typing import Any, Dict, List, Optional, Type, TypeVar
+import sqlite3
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 
-from sqlalchemy import asc, desc, or_, and_
+from sqlalchemy import asc, desc, func, inspect, or_, and_, text, tuple_
 from sqlalchemy.orm import Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=256)
+def _model_columns(model: type) -> Dict[str, Any]:
+    """
+    Cache the mapped attributes of a model as a name -> attribute dict.
+
+    Model schemas are fixed at runtime, so resolving the instrumented
+    attributes once per model replaces the per-request hasattr/getattr
+    descriptor lookups with a single dict access.
+
+    Args:
+        model: SQLAlchemy model class
+
+    Returns:
+        Dict mapping attribute names to instrumented attributes
+    """
+    return {attr.key: getattr(model, attr.key) for attr in inspect(model).attrs}
+
+
+# Filter operator dispatch table: operator -> callable(field, value)
+# returning a clause element, or None when the value shape is invalid
+# (e.g. a non-list for "in"/"notin")
+_FILTER_OPS = {
+    "eq": lambda f, v: f.in_(v) if isinstance(v, list) else f == v,
+    "ne": lambda f, v: f != v,
+    "gt": lambda f, v: f > v,
+    "gte": lambda f, v: f >= v,
+    "lt": lambda f, v: f < v,
+    "lte": lambda f, v: f <= v,
+    "like": lambda f, v: f.like(v),
+    "ilike": lambda f, v: f.ilike(v),
+    "in": lambda f, v: f.in_(v) if isinstance(v, list) else None,
+    "notin": lambda f, v: ~f.in_(v) if isinstance(v, list) else None,
+    "isnull": lambda f, v: f.is_(None) if v else f.isnot(None),
+    "contains": lambda f, v: f.contains(v),
+}
+
+
 class PaginationParams(BaseModel):
     """Pagination parameters."""
     
     limit: int = Field(default=50, ge=1, le=1000, description="Number of items per page")
     offset: int = Field(default=0, ge=0, description="Number of items to skip")
-    
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Keyset cursor from a previous page (takes precedence over offset)"
+    )
+    cursor_field: Optional[str] = Field(
+        default=None,
+        description="Field the keyset cursor orders by (defaults to id)"
+    )
+
     @property
     def page(self) -> int:
         """Calculate page number from offset."""
@@ -80,6 +129,96 @@ def apply_pagination(
     return query.limit(pagination.limit).offset(pagination.offset)
 
 
+def encode_cursor(sort_value: Any, last_id: Any) -> str:
+    """
+    Encode a keyset cursor from the last row of a page.
+
+    Args:
+        sort_value: Value of the cursor field on the last row
+        last_id: Primary key of the last row (tie-breaker)
+
+    Returns:
+        Opaque base64 cursor string
+    """
+    if isinstance(sort_value, datetime):
+        # Match SQLite's stored text form (microseconds always present),
+        # so the seek comparison excludes the cursor row exactly
+        sort_value = sort_value.isoformat(sep=" ", timespec="microseconds")
+    raw = f"{sort_value}|{last_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Decode a keyset cursor back into (sort_value, last_id).
+
+    Args:
+        cursor: Cursor string produced by encode_cursor
+
+    Returns:
+        Tuple of (sort_value, last_id) as strings
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+    sort_value, sep, last_id = raw.rpartition("|")
+    if not sep:
+        raise ValueError(f"Malformed cursor: {cursor}")
+    return sort_value, last_id
+
+
+def apply_keyset_pagination(
+    query: Query,
+    model: Type[T],
+    pagination: PaginationParams
+) -> Query:
+    """
+    Apply keyset (cursor) pagination to a query.
+
+    Unlike OFFSET, which scans and discards rows linearly with page
+    depth, keyset pagination seeks directly to the position after the
+    last row of the previous page using the (cursor_field, id) index,
+    so every page costs the same.
+
+    Args:
+        query: SQLAlchemy query
+        model: SQLAlchemy model class (must have an id column)
+        pagination: Pagination parameters with optional cursor/cursor_field
+
+    Returns:
+        Query ordered by (cursor_field, id) and limited to the page size
+
+    Raises:
+        ValueError: If the cursor cannot be decoded. Silently ignoring a
+            bad cursor would restart the caller from page one, which a
+            client iterating to exhaustion reads as duplicated rows;
+            endpoints translate this into a 400
+    """
+    field_name = pagination.cursor_field or "id"
+
+    field = _model_columns(model).get(field_name)
+    if field is None:
+        logger.warning(f"Field {field_name} not found on model {model.__name__}")
+        return query.limit(pagination.limit)
+
+    if pagination.cursor:
+        sort_value, last_id = decode_cursor(pagination.cursor)
+        if field_name == "id":
+            query = query.filter(field > last_id)
+        else:
+            query = query.filter(
+                tuple_(field, model.id) > (sort_value, last_id)
+            )
+
+    if field_name == "id":
+        query = query.order_by(asc(field))
+    else:
+        query = query.order_by(asc(field), asc(model.id))
+
+    return query.limit(pagination.limit)
+
+
 def apply_sorting(
     query: Query,
     sort_params: SortParams,
@@ -107,13 +246,11 @@ def apply_sorting(
         return query
     
     # Check if field exists on model
-    if not hasattr(model, sort_params.sort_by):
+    field = _model_columns(model).get(sort_params.sort_by)
+    if field is None:
         logger.warning(f"Field {sort_params.sort_by} not found on model {model.__name__}")
         return query
     
-    # Get field
-    field = getattr(model, sort_params.sort_by)
-    
     # Apply sort order
     order = sort_params.validate_sort_order()
     if order == "desc":
@@ -149,143 +286,314 @@ def apply_filters(
     Returns:
         Query with filters applied
     """
+    # Collect conditions and apply them in one filter() call, instead of
+    # rebuilding the (immutable) Query once per condition
+    conds = []
+    cols = _model_columns(model)
+
     for key, value in filters.items():
         # Skip None values
         if value is None:
             continue
-        
+
         # Parse field name and operator
         if "__" in key:
             field_name, operator = key.rsplit("__", 1)
         else:
             field_name = key
             operator = "eq"
-        
+
         # Validate field name
         if allowed_fields and field_name not in allowed_fields:
             logger.warning(f"Invalid filter field: {field_name}")
             continue
-        
+
         # Check if field exists on model
-        if not hasattr(model, field_name):
+        field = cols.get(field_name)
+        if field is None:
             logger.warning(f"Field {field_name} not found on model {model.__name__}")
             continue
-        
-        # Get field
-        field = getattr(model, field_name)
-        
-        # Apply operator
+
+        # Apply operator via the dispatch table
+        op = _FILTER_OPS.get(operator)
+        if op is None:
+            logger.warning(f"Unknown operator: {operator}")
+            continue
+
         try:
-            if operator == "eq":
-                if isinstance(value, list):
-                    query = query.filter(field.in_(value))
-                else:
-                    query = query.filter(field == value)
-            elif operator == "ne":
-                query = query.filter(field != value)
-            elif operator == "gt":
-                query = query.filter(field > value)
-            elif operator == "gte":
-                query = query.filter(field >= value)
-            elif operator == "lt":
-                query = query.filter(field < value)
-            elif operator == "lte":
-                query = query.filter(field <= value)
-            elif operator == "like":
-                query = query.filter(field.like(value))
-            elif operator == "ilike":
-                query = query.filter(field.ilike(value))
-            elif operator == "in":
-                if isinstance(value, list):
-                    query = query.filter(field.in_(value))
-            elif operator == "notin":
-                if isinstance(value, list):
-                    query = query.filter(~field.in_(value))
-            elif operator == "isnull":
-                if value:
-                    query = query.filter(field.is_(None))
-                else:
-                    query = query.filter(field.isnot(None))
-            elif operator == "contains":
-                query = query.filter(field.contains(value))
-            else:
-                logger.warning(f"Unknown operator: {operator}")
+            cond = op(field, value)
+            if cond is not None:
+                conds.append(cond)
         except Exception as e:
             logger.error(f"Error applying filter {key}={value}: {e}")
-    
+
+    if conds:
+        query = query.filter(and_(*conds))
+
     return query
 
 
+def _is_postgres(query: Query) -> bool:
+    """Check whether the query is bound to a PostgreSQL backend."""
+    try:
+        return query.session.get_bind().dialect.name == "postgresql"
+    except Exception:
+        return False
+
+
 def apply_search(
     query: Query,
     search_term: str,
     search_fields: List[str],
-    model: Type[T]
+    model: Type[T],
+    search_strategy: str = "ilike"
 ) -> Query:
     """
     Apply search across multiple fields.
-    
+
     Args:
         query: SQLAlchemy query
         search_term: Search term
         search_fields: List of field names to search
         model: SQLAlchemy model class
-    
+        search_strategy: One of 'ilike', 'fts' or 'trigram'. The 'fts'
+            and 'trigram' strategies emit PostgreSQL index-friendly
+            predicates (tsvector match / pg_trgm similarity) and fall
+            back to ilike on other backends
+
     Returns:
         Query with search applied
     """
     if not search_term or not search_fields:
         return query
-    
+
+    # Index-backed strategies only exist on PostgreSQL
+    if search_strategy != "ilike" and not _is_postgres(query):
+        search_strategy = "ilike"
+
     # Build OR conditions for all search fields
     conditions = []
+    cols = _model_columns(model)
     for field_name in search_fields:
-        if hasattr(model, field_name):
-            field = getattr(model, field_name)
-            # Use case-insensitive LIKE
-            conditions.append(field.ilike(f"%{search_term}%"))
-    
+        field = cols.get(field_name)
+        if field is not None:
+            if search_strategy == "fts":
+                # Matches a GIN index on to_tsvector('simple', field)
+                conditions.append(
+                    func.to_tsvector("simple", field).op("@@")(
+                        func.plainto_tsquery("simple", search_term)
+                    )
+                )
+            elif search_strategy == "trigram":
+                # Matches a pg_trgm GIN/GiST index
+                conditions.append(field.op("%")(search_term))
+            else:
+                # Use case-insensitive LIKE
+                conditions.append(field.ilike(f"%{search_term}%"))
+
     if conditions:
         query = query.filter(or_(*conditions))
-    
+
     return query
 
 
+def _supports_window_functions(query: Query) -> bool:
+    """
+    Check whether the query's backend supports window functions.
+
+    SQLite gained window function support in 3.25; everything else this
+    package targets (e.g. PostgreSQL) has had them for a long time.
+
+    Args:
+        query: SQLAlchemy query bound to a session
+
+    Returns:
+        True if COUNT(*) OVER () can be used
+    """
+    try:
+        dialect = query.session.get_bind().dialect
+    except Exception:
+        return False
+
+    if dialect.name == "sqlite":
+        return sqlite3.sqlite_version_info >= (3, 25, 0)
+    return True
+
+
+def _fast_count(query: Query) -> int:
+    """
+    Count the rows matching a query without subquery wrapping.
+
+    Query.count() wraps the full SELECT in a subquery; counting via
+    with_entities keeps only the WHERE clause, and order_by(None)
+    drops any ORDER BY the database would otherwise evaluate during
+    the count.
+
+    Args:
+        query: SQLAlchemy query
+
+    Returns:
+        Number of matching rows
+    """
+    count_query = query.order_by(None).with_entities(func.count())
+
+    # An unfiltered query leaves count(*) with nothing to infer the
+    # FROM clause from; pin it to the primary entity in that case
+    if not count_query.statement.get_final_froms():
+        descriptions = query.column_descriptions
+        if descriptions and descriptions[0].get("entity") is not None:
+            count_query = count_query.select_from(descriptions[0]["entity"])
+
+    return count_query.scalar() or 0
+
+
+def _approximate_count(query: Query) -> Optional[int]:
+    """
+    Return a planner-estimated row count, if one is available.
+
+    An exact COUNT(*) over a large table scans every row, and on big
+    tables it dominates the cost of a paginated listing. PostgreSQL
+    keeps a statistics-based estimate in pg_class.reltuples that a
+    single catalog lookup retrieves; that estimate is only valid for
+    the whole table, so any filtered query falls back to exact counting.
+
+    Args:
+        query: SQLAlchemy query bound to a session
+
+    Returns:
+        Estimated row count, or None when no usable estimate exists
+        (non-PostgreSQL backend, filtered query, or never-analyzed table)
+    """
+    if not _is_postgres(query):
+        return None
+    if query.whereclause is not None:
+        return None
+
+    descriptions = query.column_descriptions
+    entity = descriptions[0].get("entity") if descriptions else None
+    if entity is None:
+        return None
+
+    try:
+        estimate = query.session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :name"),
+            {"name": entity.__tablename__},
+        ).scalar()
+    except Exception as e:
+        logger.warning(f"Failed to read row estimate for {entity.__tablename__}: {e}")
+        return None
+
+    # reltuples is -1 until the table has been vacuumed or analyzed
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+def _fetch_page(
+    query: Query,
+    pagination: PaginationParams,
+    transform: Optional[Any] = None
+) -> Tuple[List[Any], int]:
+    """
+    Fetch one page of rows and the total count.
+
+    Rows are streamed from the DB cursor via yield_per and optionally
+    transformed as they arrive, so only one page-sized list is ever
+    materialized (instead of a raw list plus a converted copy).
+
+    Args:
+        query: SQLAlchemy query
+        pagination: Pagination parameters
+        transform: Optional callable applied to each entity as it streams
+
+    Returns:
+        Tuple of (items, total)
+    """
+    if transform is None:
+        transform = lambda entity: entity  # noqa: E731
+
+    if _supports_window_functions(query):
+        # Single round trip: fetch the page plus a windowed COUNT(*)
+        # total, letting the planner reuse the filter scan
+        rows = (
+            query.add_columns(func.count().over().label('_total'))
+            .limit(pagination.limit)
+            .offset(pagination.offset)
+            .yield_per(pagination.limit)
+        )
+        total = 0
+        items = []
+        for row in rows:
+            total = row._total
+            items.append(transform(row[0]))
+        if not items:
+            # Offset past the end of the result set: no rows come back,
+            # so the total has to be counted separately
+            total = _fast_count(query)
+    else:
+        # Fallback two-query path for backends without window functions
+        total = _fast_count(query)
+        items = [
+            transform(entity)
+            for entity in (
+                query.limit(pagination.limit)
+                .offset(pagination.offset)
+                .yield_per(pagination.limit)
+            )
+        ]
+
+    return items, total
+
+
+def _page_metadata(total: int, pagination: PaginationParams) -> Dict[str, Any]:
+    """
+    Compute pagination metadata for a result set.
+
+    Args:
+        total: Total number of matching rows
+        pagination: Pagination parameters
+
+    Returns:
+        Dict with page, total_pages, has_next and has_prev
+    """
+    total_pages = (total + pagination.limit - 1) // pagination.limit if pagination.limit > 0 else 1
+    page = pagination.page
+    return {
+        "page": page,
+        "total_pages": total_pages,
+        "has_next": page < total_pages,
+        "has_prev": page > 1,
+    }
+
+
 def paginate(
     query: Query,
     pagination: PaginationParams
 ) -> PaginatedResponse:
     """
     Execute a query with pagination and return paginated response.
-    
+
     Args:
         query: SQLAlchemy query
         pagination: Pagination parameters
-    
+
     Returns:
         PaginatedResponse with items and metadata
     """
-    # Get total count
-    total = query.count()
-    
-    # Apply pagination
-    items = query.limit(pagination.limit).offset(pagination.offset).all()
-    
-    # Calculate metadata
-    total_pages = (total + pagination.limit - 1) // pagination.limit if pagination.limit > 0 else 1
-    page = pagination.page
-    has_next = page < total_pages
-    has_prev = page > 1
-    
-    return PaginatedResponse(
+    items, total = _fetch_page(query, pagination)
+    meta = _page_metadata(total, pagination)
+
+    # All fields are computed server-side from trusted values, so skip
+    # Pydantic validation with model_construct
+    return PaginatedResponse.model_construct(
         items=items,
         total=total,
         limit=pagination.limit,
         offset=pagination.offset,
-        page=page,
-        total_pages=total_pages,
-        has_next=has_next,
-        has_prev=has_prev
+        page=meta["page"],
+        total_pages=meta["total_pages"],
+        has_next=meta["has_next"],
+        has_prev=meta["has_prev"]
     )
 
 
@@ -298,11 +606,12 @@ def build_query(
     search_term: Optional[str] = None,
     search_fields: Optional[List[str]] = None,
     allowed_filter_fields: Optional[List[str]] = None,
-    allowed_sort_fields: Optional[List[str]] = None
+    allowed_sort_fields: Optional[List[str]] = None,
+    search_strategy: str = "ilike"
 ) -> Query:
     """
     Build a complete query with filtering, sorting, and pagination.
-    
+
     Args:
         base_query: Base SQLAlchemy query
         model: SQLAlchemy model class
@@ -313,7 +622,8 @@ def build_query(
         search_fields: Fields to search
         allowed_filter_fields: Allowed fields for filtering
         allowed_sort_fields: Allowed fields for sorting
-    
+        search_strategy: Search strategy passed through to apply_search
+
     Returns:
         Complete query with all parameters applied
     """
@@ -325,19 +635,39 @@ def build_query(
     
     # Apply search
     if search_term and search_fields:
-        query = apply_search(query, search_term, search_fields, model)
+        query = apply_search(query, search_term, search_fields, model, search_strategy)
     
     # Apply sorting
     if sort_params:
         query = apply_sorting(query, sort_params, model, allowed_sort_fields)
     
-    # Apply pagination
+    # Apply pagination (keyset when a cursor is provided, offset otherwise)
     if pagination:
-        query = apply_pagination(query, pagination)
-    
+        if pagination.cursor:
+            query = apply_keyset_pagination(query, model, pagination)
+        else:
+            query = apply_pagination(query, pagination)
+
     return query
 
 
+@lru_cache(maxsize=64)
+def _list_adapter(response_model: Type[BaseModel]) -> TypeAdapter:
+    """
+    Cache a TypeAdapter(List[response_model]) per response model.
+
+    Validating a whole page through one adapter call stays inside
+    pydantic-core instead of re-entering it once per row.
+
+    Args:
+        response_model: Pydantic model class for one item
+
+    Returns:
+        TypeAdapter for a list of that model
+    """
+    return TypeAdapter(List[response_model])
+
+
 def create_paginated_response(
     query: Query,
     pagination: PaginationParams,
@@ -354,21 +684,56 @@ def create_paginated_response(
     Returns:
         Dictionary with paginated data
     """
-    result = paginate(query, pagination)
-    
-    # Convert items to response model if provided
-    if response_model:
-        items = [response_model.model_validate(item) for item in result.items]
+    # Unfiltered listings on PostgreSQL can serve the total from the
+    # planner's estimate instead of scanning the table for COUNT(*)
+    estimate = _approximate_count(query)
+
+    if pagination.cursor_field:
+        # Keyset page: seek past the cursor row instead of OFFSET-scanning,
+        # so deep pages cost the same as the first. The total still counts
+        # the full filtered set, not just the rows after the cursor
+        total = estimate if estimate is not None else _fast_count(query)
+        entity = query.column_descriptions[0]["entity"]
+        items = apply_keyset_pagination(query, entity, pagination).all()
+    elif estimate is not None:
+        total = estimate
+        items = list(
+            query.limit(pagination.limit)
+            .offset(pagination.offset)
+            .yield_per(pagination.limit)
+        )
     else:
-        items = result.items
-    
-    return {
+        items, total = _fetch_page(query, pagination)
+
+    # Validate the whole page in one pydantic-core call and dump it back
+    # to JSON-ready dicts (when a response model is given), so FastAPI's
+    # encoder fast-paths the payload instead of re-serializing each model
+    raw_items = items
+    if response_model is not None:
+        adapter = _list_adapter(response_model)
+        items = adapter.dump_python(
+            adapter.validate_python(items, from_attributes=True),
+            mode="json",
+        )
+
+    response = {
         "items": items,
-        "total": result.total,
-        "limit": result.limit,
-        "offset": result.offset,
-        "page": result.page,
-        "total_pages": result.total_pages,
-        "has_next": result.has_next,
-        "has_prev": result.has_prev
+        "total": total,
+        "limit": pagination.limit,
+        "offset": pagination.offset,
+        **_page_metadata(total, pagination),
     }
+
+    # Flag estimated totals so clients don't treat them as exact
+    if estimate is not None:
+        response["total_approx"] = True
+
+    # Emit a keyset cursor for the next page when cursor pagination is in use
+    if pagination.cursor_field and raw_items:
+        last = raw_items[-1]
+        if hasattr(last, pagination.cursor_field) and hasattr(last, "id"):
+            response["next_cursor"] = encode_cursor(
+                getattr(last, pagination.cursor_field), last.id
+            )
+
+    return response
@@ -5,21 +5,183 @@ This module provides functionality to check for and install updates
 to the Python backend package.
 """
 
+import atexit
 import hashlib
 import json
 import logging
 import os
 import shutil
+import sys
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from urllib.parse import urljoin
 
-import httpx
+from packaging.version import InvalidVersion, Version
+
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import blake3
+    _HAS_BLAKE3 = True
+except ImportError:
+    _HAS_BLAKE3 = False
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _parse_version(version: str) -> Optional[Version]:
+    """Parse a version string once, caching the result.
+
+    Args:
+        version: Version string (e.g., "2.1.0", "2.1.0-rc1")
+
+    Returns:
+        Parsed Version, or None if the string is not a valid version
+    """
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return None
+
+
+# FICLONE ioctl (Linux): shares data blocks between two files on CoW
+# filesystems (btrfs, XFS with reflink), making the copy O(metadata)
+_FICLONE = 0x40049409
+
+# Download in 1 MiB chunks: ~128x fewer loop iterations and write()
+# syscalls per MB than the httpx default, letting the kernel coalesce
+# writes into large, block-aligned I/O
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=1)
+def _get_extract_pool() -> ProcessPoolExecutor:
+    """Build the worker pool for zip extraction on first use.
+
+    Extraction of a large archive (per-file CRC-32, mkdir, write) is
+    CPU- and syscall-heavy; running it in a worker process keeps this
+    process's GIL free so the API server stays responsive during an
+    install. Shut down by an atexit hook.
+    """
+    pool = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+    atexit.register(pool.shutdown)
+    return pool
+
+
+def _extract_zip(zip_source, install_dir: str) -> None:
+    """Extract an update archive over an installation directory.
+
+    Unlinks files the archive will overwrite so the extraction writes
+    fresh inodes; in-place truncation would corrupt a hardlinked
+    backup of the installation.
+
+    Args:
+        zip_source: Path or binary file object containing the zip
+        install_dir: Directory to extract into
+    """
+    import zipfile
+
+    install_path = Path(install_dir)
+    with zipfile.ZipFile(zip_source, "r") as zip_ref:
+        for name in zip_ref.namelist():
+            target = install_path / name
+            if not name.endswith("/") and target.is_file():
+                target.unlink()
+        zip_ref.extractall(install_path)
+
+
+@lru_cache(maxsize=1)
+def _get_shared_client() -> "httpx.Client":
+    """Build the process-wide HTTP client on first use.
+
+    Deferred behind a cached factory so importing this module doesn't
+    pay httpx's cold-import cost (h11, anyio, certifi — tens of ms) on
+    server or CLI startup. Long keepalive so repeated GitHub calls
+    reuse the pooled TLS session instead of paying a fresh handshake
+    per call; HTTP/2 is enabled when the optional h2 package is
+    installed. Closed by an atexit hook.
+    """
+    import httpx
+
+    limits = httpx.Limits(keepalive_expiry=300.0)
+    try:
+        client = httpx.Client(http2=True, timeout=30.0, limits=limits)
+    except ImportError:
+        client = httpx.Client(timeout=30.0, limits=limits)
+    atexit.register(client.close)
+    return client
+
+
+def _clone_or_copy(src: str, dst: str) -> None:
+    """Copy a single file, preferring a CoW reflink clone when supported."""
+    if sys.platform == "linux":
+        try:
+            import fcntl
+
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            # Cross-device copy or a filesystem without reflink support
+            pass
+    shutil.copy2(src, dst)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink a single file, falling back to a copy.
+
+    A hardlink shares the inode, so linking an entire tree is
+    O(inode count) instead of O(bytes). Falls back to reflink/copy when
+    src and dst are on different filesystems.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        _clone_or_copy(src, dst)
+
+
+def _parallel_copytree(src: Path, dst: Path, copy_function=_clone_or_copy) -> None:
+    """Copy a directory tree, skipping bytecode caches.
+
+    Each file is cloned via reflink where the filesystem supports it;
+    otherwise files are copied concurrently in a thread pool so several
+    copies are in flight at once instead of moving bytes serially.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (created if missing)
+        copy_function: Per-file copy callable (src, dst)
+    """
+    copies = []
+    for root, dirs, files in os.walk(src):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        rel = os.path.relpath(root, src)
+        target_root = dst if rel == "." else dst / rel
+        target_root.mkdir(parents=True, exist_ok=True)
+        for name in files:
+            if name.endswith(".pyc"):
+                continue
+            copies.append((os.path.join(root, name), str(target_root / name)))
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+        futures = [executor.submit(copy_function, s, d) for s, d in copies]
+        for future in futures:
+            future.result()
+
+
 class BackendUpdater:
     """Handles checking and installing updates for the Python backend."""
 
@@ -27,16 +189,107 @@ class BackendUpdater:
         self,
         update_server_url: str = "https://api.github.com/repos/ConardLi/easy-dataset/releases",
         current_version: str = "2.0.0",
+        client: Optional["httpx.Client"] = None,
     ):
         """Initialize the updater.
 
         Args:
             update_server_url: URL to check for updates
             current_version: Current version of the backend
+            client: HTTP client to use; defaults to the shared
+                pooled client so short-lived updaters reuse connections
         """
         self.update_server_url = update_server_url
         self.current_version = current_version
-        self.client = httpx.Client(timeout=30.0)
+        # Parse eagerly so every later check compares cached Versions
+        self._parsed_current_version = _parse_version(current_version)
+        # Neither path hands this instance a client of its own: a
+        # caller-supplied client is the caller's to close, and the
+        # shared default is closed by its atexit hook. The flag exists
+        # for any future path that constructs a private client here
+        self._owns_client = False
+        self.client = client if client is not None else _get_shared_client()
+        # Conditional-request cache for the releases listing (ETag plus
+        # last parsed body), persisted across processes
+        self._release_cache_file = (
+            Path.home() / ".easy_dataset" / "releases.cache.json"
+        )
+
+    def _load_release_cache(self) -> Optional[dict]:
+        """Load the cached releases listing, or None if absent/corrupt."""
+        try:
+            return json.loads(self._release_cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _store_release_cache(
+        self, etag: Optional[str], releases: list, poll_interval: int
+    ) -> None:
+        """Persist the releases listing alongside its ETag.
+
+        Args:
+            etag: ETag header from the releases response
+            releases: Parsed releases body
+            poll_interval: Seconds GitHub asks us to wait between polls
+        """
+        try:
+            self._release_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self._release_cache_file.write_text(
+                json.dumps(
+                    {
+                        "etag": etag,
+                        "releases": releases,
+                        "checked_at": time.time(),
+                        "poll_interval": poll_interval,
+                    }
+                )
+            )
+        except OSError as e:
+            # Cache is best-effort; update checks work without it
+            logger.debug(f"Could not write releases cache: {e}")
+
+    def _fetch_releases(self) -> Optional[list]:
+        """Fetch the releases listing, using conditional requests.
+
+        Sends If-None-Match with the cached ETag so an unchanged listing
+        comes back as a bodyless 304 and the cached JSON is reused;
+        within GitHub's advertised X-Poll-Interval window the network is
+        skipped entirely.
+
+        Returns:
+            Parsed releases list, or None if the request failed
+        """
+        cached = self._load_release_cache()
+
+        if cached is not None:
+            age = time.time() - cached.get("checked_at", 0)
+            if 0 <= age < cached.get("poll_interval", 0):
+                return cached.get("releases")
+
+        headers = {"Accept": "application/vnd.github+json"}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
+        response = self.client.get(self.update_server_url, headers=headers)
+        poll_interval = int(response.headers.get("X-Poll-Interval", 0))
+
+        if response.status_code == 304 and cached is not None:
+            # Not modified: zero-byte body, reuse the cached listing
+            releases = cached.get("releases", [])
+            self._store_release_cache(cached.get("etag"), releases, poll_interval)
+            return releases
+
+        response.raise_for_status()
+        # orjson parses the raw response bytes without a text-mode
+        # decode pass; the listing can run to ~100 KB
+        if _HAS_ORJSON:
+            releases = orjson.loads(response.content)
+        else:
+            releases = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._store_release_cache(etag, releases, poll_interval)
+        return releases
 
     def check_for_updates(self) -> Optional[dict]:
         """Check if updates are available.
@@ -50,13 +303,13 @@ class BackendUpdater:
                 'published_at': '2024-01-01T00:00:00Z'
             }
         """
+        # Local import: httpx is only loaded when network calls happen
+        import httpx
+
         try:
             logger.info(f"Checking for updates from {self.update_server_url}")
 
-            response = self.client.get(self.update_server_url)
-            response.raise_for_status()
-
-            releases = response.json()
+            releases = self._fetch_releases()
 
             if not releases:
                 logger.info("No releases found")
@@ -104,17 +357,28 @@ class BackendUpdater:
             return None
 
     def download_update(
-        self, download_url: str, progress_callback: Optional[callable] = None
+        self,
+        download_url: str,
+        progress_callback: Optional[callable] = None,
+        expected_hash: Optional[str] = None,
     ) -> Optional[Path]:
         """Download an update package.
 
+        Hashes each buffer as it arrives, so callers that pass
+        expected_hash get integrity verification for free without a
+        second full read of the file (no separate verify_update pass).
+
         Args:
             download_url: URL to download the update from
             progress_callback: Optional callback for progress updates (bytes_downloaded, total_bytes)
+            expected_hash: Optional expected SHA256 hash, verified in-stream
 
         Returns:
-            Path to the downloaded file, or None if download failed
+            Path to the downloaded file, or None if download or
+            verification failed
         """
+        import httpx
+
         try:
             logger.info(f"Downloading update from {download_url}")
 
@@ -122,22 +386,35 @@ class BackendUpdater:
             temp_dir = tempfile.mkdtemp(prefix="easy_dataset_update_")
             temp_file = Path(temp_dir) / "update.zip"
 
-            # Download with progress tracking
+            # Download with progress tracking, hashing each chunk while
+            # it's still cache-resident
+            sha256_hash = hashlib.sha256()
             with self.client.stream("GET", download_url) as response:
                 response.raise_for_status()
 
                 total_size = int(response.headers.get("content-length", 0))
                 downloaded = 0
 
-                with open(temp_file, "wb") as f:
-                    for chunk in response.iter_bytes(chunk_size=8192):
+                # Buffer matches the chunk size so each chunk goes to
+                # the kernel in a single write
+                with open(temp_file, "wb", buffering=_DOWNLOAD_CHUNK_SIZE) as f:
+                    for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        sha256_hash.update(chunk)
                         f.write(chunk)
                         downloaded += len(chunk)
 
                         if progress_callback:
                             progress_callback(downloaded, total_size)
 
-            logger.info(f"Update downloaded to {temp_file}")
+            calculated_hash = sha256_hash.hexdigest()
+            if expected_hash and calculated_hash != expected_hash:
+                logger.error(
+                    f"Hash mismatch! Expected: {expected_hash}, Got: {calculated_hash}"
+                )
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                return None
+
+            logger.info(f"Update downloaded to {temp_file} (sha256: {calculated_hash})")
             return temp_file
 
         except httpx.HTTPError as e:
@@ -147,12 +424,20 @@ class BackendUpdater:
             logger.error(f"Unexpected error downloading update: {e}", exc_info=True)
             return None
 
-    def verify_update(self, update_file: Path, expected_hash: Optional[str] = None) -> bool:
+    def verify_update(
+        self,
+        update_file: Path,
+        expected_hash: Optional[str] = None,
+        expected_blake3: Optional[str] = None,
+    ) -> bool:
         """Verify the integrity of an update package.
 
         Args:
             update_file: Path to the update file
             expected_hash: Expected SHA256 hash (optional)
+            expected_blake3: Expected BLAKE3 hash (optional); used when
+                the blake3 package is installed, which hashes the
+                mmapped file with SIMD tree hashing across threads
 
         Returns:
             True if verification passed, False otherwise
@@ -162,13 +447,48 @@ class BackendUpdater:
                 logger.error(f"Update file not found: {update_file}")
                 return False
 
-            # Calculate hash
-            sha256_hash = hashlib.sha256()
-            with open(update_file, "rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
-                    sha256_hash.update(chunk)
+            if expected_blake3:
+                if _HAS_BLAKE3:
+                    hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+                    hasher.update_mmap(update_file)
+                    calculated_blake3 = hasher.hexdigest()
+                    if calculated_blake3 != expected_blake3:
+                        logger.error(
+                            f"BLAKE3 mismatch! Expected: {expected_blake3}, "
+                            f"Got: {calculated_blake3}"
+                        )
+                        return False
+                    logger.info("BLAKE3 verification passed")
+                    if not expected_hash:
+                        return True
+                else:
+                    logger.warning(
+                        "blake3 not installed; verifying with SHA-256 only"
+                    )
 
-            calculated_hash = sha256_hash.hexdigest()
+            # Calculate hash. file_digest (Python >= 3.11) hashes through
+            # OpenSSL's EVP interface, which dispatches to hardware
+            # SHA-256 (SHA-NI / ARMv8 SHA2) where available
+            with open(update_file, "rb") as f:
+                if hasattr(hashlib, "file_digest"):
+                    calculated_hash = hashlib.file_digest(f, "sha256").hexdigest()
+                else:
+                    # Pre-3.11 fallback: hash the mmapped file so pages
+                    # go straight to OpenSSL via the buffer protocol,
+                    # with no per-chunk bytes allocations
+                    import mmap
+
+                    sha256_hash = hashlib.sha256()
+                    try:
+                        with mmap.mmap(
+                            f.fileno(), 0, access=mmap.ACCESS_READ
+                        ) as mapped:
+                            sha256_hash.update(mapped)
+                    except (ValueError, OSError):
+                        # Empty file or mmap-hostile filesystem
+                        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                            sha256_hash.update(chunk)
+                    calculated_hash = sha256_hash.hexdigest()
 
             if expected_hash:
                 if calculated_hash != expected_hash:
@@ -196,11 +516,88 @@ class BackendUpdater:
         Returns:
             True if installation succeeded, False otherwise
         """
+        if not update_file.exists():
+            logger.error(f"Update file not found: {update_file}")
+            return False
+
+        return self._install_zip(update_file, install_dir)
+
+    def install_from_url(
+        self,
+        download_url: str,
+        install_dir: Optional[Path] = None,
+        expected_hash: Optional[str] = None,
+        progress_callback: Optional[callable] = None,
+        spool_max_size: int = 256 * 1024 * 1024,
+    ) -> bool:
+        """Download and install an update in a single pass.
+
+        Streams the archive into a spooled buffer (held in memory up to
+        spool_max_size, spilling to disk beyond that), hashing bytes as
+        they arrive, and extracts directly from that buffer. Compared to
+        download_update + install_update this skips writing a temp zip
+        and reading it back when the archive fits in memory.
+
+        Args:
+            download_url: URL to download the update from
+            install_dir: Directory to install to (defaults to current installation)
+            expected_hash: Optional expected SHA256 hash, verified in-stream
+            progress_callback: Optional callback for progress updates (bytes_downloaded, total_bytes)
+            spool_max_size: Bytes to keep in memory before spilling to disk
+
+        Returns:
+            True if download and installation succeeded, False otherwise
+        """
+        import httpx
+
         try:
-            if not update_file.exists():
-                logger.error(f"Update file not found: {update_file}")
-                return False
+            logger.info(f"Downloading update from {download_url}")
+
+            with tempfile.SpooledTemporaryFile(max_size=spool_max_size) as buffer:
+                sha256_hash = hashlib.sha256()
+
+                with self.client.stream("GET", download_url) as response:
+                    response.raise_for_status()
+
+                    total_size = int(response.headers.get("content-length", 0))
+                    downloaded = 0
+
+                    for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        sha256_hash.update(chunk)
+                        buffer.write(chunk)
+                        downloaded += len(chunk)
 
+                        if progress_callback:
+                            progress_callback(downloaded, total_size)
+
+                calculated_hash = sha256_hash.hexdigest()
+                if expected_hash and calculated_hash != expected_hash:
+                    logger.error(
+                        f"Hash mismatch! Expected: {expected_hash}, Got: {calculated_hash}"
+                    )
+                    return False
+
+                buffer.seek(0)
+                return self._install_zip(buffer, install_dir)
+
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to download update: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error installing update: {e}", exc_info=True)
+            return False
+
+    def _install_zip(self, zip_source, install_dir: Optional[Path]) -> bool:
+        """Back up the current installation and extract an update archive.
+
+        Args:
+            zip_source: Path or binary file object containing the zip
+            install_dir: Directory to install to (defaults to current installation)
+
+        Returns:
+            True if installation succeeded, False otherwise
+        """
+        try:
             if install_dir is None:
                 # Determine installation directory
                 install_dir = Path(__file__).parent.parent.parent
@@ -213,14 +610,22 @@ class BackendUpdater:
                 shutil.rmtree(backup_dir)
 
             logger.info(f"Creating backup at {backup_dir}")
-            shutil.copytree(install_dir, backup_dir, ignore=shutil.ignore_patterns("*.pyc", "__pycache__"))
+            # Hardlink the backup: the sibling directory is on the same
+            # filesystem, so backing up costs one link() per file rather
+            # than a byte-for-byte copy
+            _parallel_copytree(install_dir, backup_dir, copy_function=_link_or_copy)
 
             try:
                 # Extract update
-                import zipfile
-
-                with zipfile.ZipFile(update_file, "r") as zip_ref:
-                    zip_ref.extractall(install_dir)
+                if isinstance(zip_source, (str, Path)):
+                    # Offload to a worker process so per-file CRC-32
+                    # checks don't hold this process's GIL
+                    _get_extract_pool().submit(
+                        _extract_zip, str(zip_source), str(install_dir)
+                    ).result()
+                else:
+                    # In-memory buffers can't cross a process boundary
+                    _extract_zip(zip_source, str(install_dir))
 
                 logger.info("Update installed successfully")
                 return True
@@ -232,7 +637,8 @@ class BackendUpdater:
                 logger.info("Restoring backup...")
                 if install_dir.exists():
                     shutil.rmtree(install_dir)
-                shutil.copytree(backup_dir, install_dir)
+                # Relink from the backup, mirroring how it was created
+                _parallel_copytree(backup_dir, install_dir, copy_function=_link_or_copy)
                 logger.info("Backup restored")
 
                 return False
@@ -251,25 +657,29 @@ class BackendUpdater:
         Returns:
             True if version1 is newer than version2
         """
-        try:
-            v1_parts = [int(x) for x in version1.split(".")]
-            v2_parts = [int(x) for x in version2.split(".")]
-
-            # Pad with zeros if needed
-            max_len = max(len(v1_parts), len(v2_parts))
-            v1_parts.extend([0] * (max_len - len(v1_parts)))
-            v2_parts.extend([0] * (max_len - len(v2_parts)))
-
-            return v1_parts > v2_parts
+        # PEP 440 comparison handles pre-release tags (rc/dev/alpha)
+        # correctly, and the parse is cached so repeat checks compare
+        # pre-built key tuples
+        v1 = _parse_version(version1)
+        v2 = _parse_version(version2)
 
-        except (ValueError, AttributeError):
+        if v1 is None or v2 is None:
             logger.warning(f"Failed to compare versions: {version1} vs {version2}")
             return False
 
+        return v1 > v2
+
     def cleanup(self):
-        """Clean up resources."""
+        """Clean up resources.
+
+        Closes the HTTP client only when this instance constructed it.
+        Caller-supplied clients belong to the caller, and the shared
+        default stays open for the life of the process (it is closed by
+        an atexit hook).
+        """
         try:
-            self.client.close()
+            if self._owns_client:
+                self.client.close()
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
 
@@ -293,20 +703,23 @@ def check_for_backend_updates(current_version: str = "2.0.0") -> Optional[dict]:
 
 
 def download_backend_update(
-    download_url: str, progress_callback: Optional[callable] = None
+    download_url: str,
+    progress_callback: Optional[callable] = None,
+    expected_hash: Optional[str] = None,
 ) -> Optional[Path]:
     """Download a backend update.
 
     Args:
         download_url: URL to download from
         progress_callback: Optional progress callback
+        expected_hash: Optional expected SHA256 hash, verified in-stream
 
     Returns:
         Path to downloaded file, or None if failed
     """
     updater = BackendUpdater()
     try:
-        return updater.download_update(download_url, progress_callback)
+        return updater.download_update(download_url, progress_callback, expected_hash)
     finally:
         updater.cleanup()
 
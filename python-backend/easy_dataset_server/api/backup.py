@@ -5,6 +5,8 @@ This module provides REST API endpoints for database backup and export.
 """
 
 import logging
+import os
+from functools import lru_cache
 from typing import Any, Dict, List
 
 from fastapi import APIRouter, HTTPException, Query, status
@@ -25,6 +27,18 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+@lru_cache(maxsize=4)
+def _get_backup_manager(database_url: str) -> DatabaseBackup:
+    """
+    Return the shared backup manager for a database URL.
+
+    DatabaseBackup carries the mtime-guarded filename index; building a
+    fresh instance per request would start that index cold every time,
+    so handlers share one instance per URL instead.
+    """
+    return DatabaseBackup(database_url)
+
+
 class BackupResponse(BaseModel):
     """Backup operation response."""
     
@@ -71,15 +85,13 @@ async def create_database_backup(
         HTTPException: If backup fails
     """
     try:
+        # Size comes back with the path, saving a separate stat and the
+        # TOCTOU window between create and stat
         if optimized:
-            backup_path = create_optimized_backup(settings.database_url)
+            backup_path, size_bytes = create_optimized_backup(settings.database_url)
         else:
-            backup_path = create_backup(settings.database_url)
-        
-        # Get backup file size
-        import os
-        size_bytes = os.path.getsize(backup_path)
-        
+            backup_path, size_bytes = create_backup(settings.database_url)
+
         return BackupResponse(
             success=True,
             message="Database backup created successfully",
@@ -107,12 +119,8 @@ async def export_database_to_sql() -> BackupResponse:
         HTTPException: If export fails
     """
     try:
-        export_path = export_database_sql(settings.database_url)
-        
-        # Get export file size
-        import os
-        size_bytes = os.path.getsize(export_path)
-        
+        export_path, size_bytes = export_database_sql(settings.database_url)
+
         return BackupResponse(
             success=True,
             message="Database exported to SQL successfully",
@@ -163,7 +171,7 @@ async def list_database_backups() -> List[BackupListItem]:
         HTTPException: If operation fails
     """
     try:
-        backup_manager = DatabaseBackup(settings.database_url)
+        backup_manager = _get_backup_manager(settings.database_url)
         backups = backup_manager.list_backups()
         return [BackupListItem(**backup) for backup in backups]
     
@@ -190,22 +198,26 @@ async def download_backup(filename: str):
         HTTPException: If file not found or download fails
     """
     try:
-        backup_manager = DatabaseBackup(settings.database_url)
-        backups = backup_manager.list_backups()
-        
-        # Find backup by filename
-        backup = next((b for b in backups if b["filename"] == filename), None)
-        
+        backup_manager = _get_backup_manager(settings.database_url)
+
+        # O(1) indexed lookup; the index only rebuilds when the backup
+        # directory changes
+        backup = backup_manager.get_backup(filename)
+
         if not backup:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Backup file not found: {filename}"
             )
         
+        # Pre-stat so FileResponse doesn't stat the file again when
+        # sending; the body itself goes out via the ASGI server's
+        # sendfile path without passing through Python
         return FileResponse(
             path=backup["path"],
             filename=filename,
-            media_type="application/octet-stream"
+            media_type="application/octet-stream",
+            stat_result=os.stat(backup["path"]),
         )
     
     except HTTPException:
@@ -239,7 +251,7 @@ async def restore_database_backup(
         HTTPException: If restore fails
     """
     try:
-        backup_manager = DatabaseBackup(settings.database_url)
+        backup_manager = _get_backup_manager(settings.database_url)
         backup_manager.restore(backup_path, overwrite=overwrite)
         
         return {
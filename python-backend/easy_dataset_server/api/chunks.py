@@ -6,15 +6,36 @@ This module provides REST API endpoints for chunk management.
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 
-from easy_dataset.models import Chunks, Projects
+from easy_dataset.models import Chunks, Questions
 from easy_dataset.schemas import ChunkCreate, ChunkResponse, ChunkUpdate
-from easy_dataset_server.dependencies import get_db
+from easy_dataset_server.dependencies import get_db, missing_projects, project_exists
 
 router = APIRouter()
 
+# Built once at import: validating a whole page through one adapter call
+# stays inside pydantic-core instead of re-entering it per row
+_CHUNK_LIST_ADAPTER = TypeAdapter(List[ChunkResponse])
+
+# Columns matching ChunkResponse, selected as plain rows so read
+# endpoints skip ORM instance materialization entirely
+_CHUNK_COLUMNS = (
+    Chunks.id,
+    Chunks.name,
+    Chunks.project_id,
+    Chunks.file_id,
+    Chunks.file_name,
+    Chunks.content,
+    Chunks.summary,
+    Chunks.size,
+    Chunks.create_at,
+    Chunks.update_at,
+)
+
 
 @router.post("/chunks", response_model=ChunkResponse, status_code=status.HTTP_201_CREATED)
 def create_chunk(
@@ -34,9 +55,8 @@ def create_chunk(
     Raises:
         HTTPException: If project not found or chunk creation fails
     """
-    # Verify project exists
-    project = db.query(Projects).filter(Projects.id == chunk.project_id).first()
-    if not project:
+    # Verify project exists (recently seen ids skip the SELECT)
+    if not project_exists(chunk.project_id, db):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {chunk.project_id} not found",
@@ -48,7 +68,7 @@ def create_chunk(
             file_id=chunk.file_id,
             content=chunk.content,
             summary=chunk.summary or "",
-            size=chunk.size or len(chunk.content),
+            size=chunk.size,
             index=chunk.index,
             tag_id=chunk.tag_id,
         )
@@ -66,6 +86,75 @@ def create_chunk(
         )
 
 
+@router.post(
+    "/chunks/bulk",
+    response_model=List[ChunkResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+def create_chunks_bulk(
+    chunks: List[ChunkCreate],
+    db: Session = Depends(get_db),
+) -> List[ChunkResponse]:
+    """
+    Create many chunks in a single statement.
+
+    Ingest pipelines create hundreds of chunks at once; inserting them
+    through the single-row endpoint costs three round-trips each. This
+    endpoint validates all referenced projects with one SELECT, then
+    inserts every row through the dialect's multi-values INSERT.
+
+    Args:
+        chunks: Chunk creation payloads
+        db: Database session
+
+    Returns:
+        Created chunks, in input order
+
+    Raises:
+        HTTPException: If any referenced project is missing or the
+            insert fails
+    """
+    if not chunks:
+        return []
+
+    # Verify all referenced projects exist (cached ids skip the SELECT,
+    # the rest are checked with one query)
+    missing = missing_projects({c.project_id for c in chunks}, db)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with id {sorted(missing)[0]} not found",
+        )
+
+    rows = [
+        {
+            "name": c.name,
+            "project_id": c.project_id,
+            "file_id": c.file_id,
+            "file_name": c.file_name,
+            "content": c.content,
+            "summary": c.summary or "",
+            "size": c.size,
+        }
+        for c in chunks
+    ]
+
+    try:
+        # executemany with RETURNING: the engine pages rows through
+        # multi-values INSERTs (insertmanyvalues) in a single commit
+        created = db.execute(
+            insert(Chunks).returning(*_CHUNK_COLUMNS), rows
+        ).mappings().all()
+        db.commit()
+        return [ChunkResponse.model_construct(**row) for row in created]
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create chunks: {str(e)}",
+        )
+
+
 @router.get("/chunks", response_model=List[ChunkResponse])
 def list_chunks(
     project_id: Optional[str] = Query(None, description="Filter by project ID"),
@@ -74,10 +163,10 @@ def list_chunks(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     db: Session = Depends(get_db),
-) -> List[ChunkResponse]:
+) -> Response:
     """
     List chunks with optional filtering.
-    
+
     Args:
         project_id: Optional project ID filter
         file_id: Optional file ID filter
@@ -85,21 +174,28 @@ def list_chunks(
         skip: Number of records to skip
         limit: Maximum number of records to return
         db: Database session
-    
+
     Returns:
         List of chunks
     """
-    query = db.query(Chunks)
-    
+    stmt = select(*_CHUNK_COLUMNS)
+
     if project_id:
-        query = query.filter(Chunks.project_id == project_id)
+        stmt = stmt.where(Chunks.project_id == project_id)
     if file_id:
-        query = query.filter(Chunks.file_id == file_id)
+        stmt = stmt.where(Chunks.file_id == file_id)
     if tag_id:
-        query = query.filter(Chunks.tag_id == tag_id)
-    
-    chunks = query.offset(skip).limit(limit).all()
-    return [ChunkResponse.model_validate(c) for c in chunks]
+        stmt = stmt.where(Chunks.tag_id == tag_id)
+
+    rows = db.execute(stmt.offset(skip).limit(limit)).all()
+
+    # Validate once and serialize straight to JSON bytes; returning a
+    # Response keeps FastAPI from re-validating through response_model
+    items = _CHUNK_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    return Response(
+        content=_CHUNK_LIST_ADAPTER.dump_json(items),
+        media_type="application/json",
+    )
 
 
 @router.get("/chunks/{chunk_id}", response_model=ChunkResponse)
@@ -120,15 +216,17 @@ def get_chunk(
     Raises:
         HTTPException: If chunk not found
     """
-    chunk = db.query(Chunks).filter(Chunks.id == chunk_id).first()
-    
-    if not chunk:
+    row = db.execute(
+        select(*_CHUNK_COLUMNS).where(Chunks.id == chunk_id)
+    ).mappings().first()
+
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Chunk with id {chunk_id} not found",
         )
-    
-    return ChunkResponse.model_validate(chunk)
+
+    return ChunkResponse.model_construct(**row)
 
 
 @router.put("/chunks/{chunk_id}", response_model=ChunkResponse)
@@ -151,28 +249,26 @@ def update_chunk(
     Raises:
         HTTPException: If chunk not found or update fails
     """
-    db_chunk = db.query(Chunks).filter(Chunks.id == chunk_id).first()
-    
-    if not db_chunk:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Chunk with id {chunk_id} not found",
-        )
-    
+    # Update only provided fields
+    update_data = chunk_update.model_dump(exclude_unset=True)
+
+    # Update size if content changed
+    if "content" in update_data:
+        update_data["size"] = len(update_data["content"])
+
+    if not update_data:
+        # Nothing to change; return the current row
+        return get_chunk(chunk_id, db)
+
     try:
-        # Update only provided fields
-        update_data = chunk_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_chunk, field, value)
-        
-        # Update size if content changed
-        if "content" in update_data:
-            db_chunk.size = len(db_chunk.content)
-        
-        db.commit()
-        db.refresh(db_chunk)
-        
-        return ChunkResponse.model_validate(db_chunk)
+        # Single UPDATE ... RETURNING round-trip instead of
+        # SELECT + SET + refresh
+        row = db.execute(
+            update(Chunks)
+            .where(Chunks.id == chunk_id)
+            .values(**update_data)
+            .returning(*_CHUNK_COLUMNS)
+        ).mappings().first()
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -180,6 +276,16 @@ def update_chunk(
             detail=f"Failed to update chunk: {str(e)}",
         )
 
+    if row is None:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Chunk with id {chunk_id} not found",
+        )
+
+    db.commit()
+    return ChunkResponse.model_construct(**row)
+
 
 @router.delete("/chunks/{chunk_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_chunk(
@@ -196,17 +302,15 @@ def delete_chunk(
     Raises:
         HTTPException: If chunk not found or deletion fails
     """
-    db_chunk = db.query(Chunks).filter(Chunks.id == chunk_id).first()
-    
-    if not db_chunk:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Chunk with id {chunk_id} not found",
-        )
-    
     try:
-        db.delete(db_chunk)
-        db.commit()
+        # Set-based deletes instead of loading the chunk and its
+        # questions into the session; the questions FK has no DB-level
+        # cascade, so dependents are removed first in the same
+        # transaction
+        db.execute(delete(Questions).where(Questions.chunk_id == chunk_id))
+        deleted_id = db.execute(
+            delete(Chunks).where(Chunks.id == chunk_id).returning(Chunks.id)
+        ).scalar_one_or_none()
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -214,3 +318,12 @@ def delete_chunk(
             detail=f"Failed to delete chunk: {str(e)}",
         )
 
+    if deleted_id is None:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Chunk with id {chunk_id} not found",
+        )
+
+    db.commit()
+
@@ -6,15 +6,106 @@ This module provides REST API endpoints for dataset management.
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import func, insert, or_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from easy_dataset.models import Datasets, Projects
+from easy_dataset.models import Datasets
 from easy_dataset.schemas import DatasetCreate, DatasetResponse, DatasetUpdate
-from easy_dataset_server.dependencies import get_db
+from easy_dataset.utils.query import (
+    PaginationParams,
+    apply_keyset_pagination,
+    encode_cursor,
+)
+from easy_dataset_server.dependencies import dataset_or_404, get_db
 
 router = APIRouter()
 
+# Built once at import: validating a whole page through one adapter call
+# stays inside pydantic-core instead of re-entering it per row
+_DATASET_LIST_ADAPTER = TypeAdapter(List[DatasetResponse])
+
+# Columns matching DatasetResponse, selected as plain rows so the list
+# endpoint skips ORM instance materialization and identity-map entries
+_DATASET_COLUMNS = (
+    Datasets.id,
+    Datasets.project_id,
+    Datasets.question_id,
+    Datasets.question,
+    Datasets.answer,
+    Datasets.answer_type,
+    Datasets.chunk_name,
+    Datasets.chunk_content,
+    Datasets.model,
+    Datasets.question_label,
+    Datasets.cot,
+    Datasets.confirmed,
+    Datasets.score,
+    Datasets.ai_evaluation,
+    Datasets.tags,
+    Datasets.note,
+    Datasets.other,
+    Datasets.create_at,
+    Datasets.update_at,
+)
+
+
+def _tags_any_filter(tag_list: List[str], dialect_name: str):
+    """
+    Build a filter matching rows whose comma-separated tags column
+    contains any of the given tags.
+
+    On PostgreSQL this uses array overlap (string_to_array && ARRAY),
+    which a GIN expression index can serve in O(log N); elsewhere it
+    pads the column with commas and matches whole ",tag," tokens, so
+    'gpu' no longer matches a row tagged 'gpu-adjacent'.
+
+    Args:
+        tag_list: Tags to match (already stripped)
+        dialect_name: Active SQLAlchemy dialect name
+
+    Returns:
+        SQLAlchemy filter expression
+    """
+    if dialect_name == "postgresql":
+        return func.string_to_array(Datasets.tags, ",").op("&&")(tag_list)
+
+    padded = "," + Datasets.tags + ","
+    return or_(*[padded.like(f"%,{tag},%") for tag in tag_list])
+
+
+def _search_filter(search: str, dialect_name: str):
+    """
+    Build a filter matching the search text in question or answer.
+
+    On PostgreSQL this runs a full-text @@ match over
+    to_tsvector('simple', question || answer), which an expression GIN
+    index (USING gin (to_tsvector('simple', question || ' ' || answer)))
+    serves as an index probe instead of a leading-wildcard scan; other
+    backends keep the portable ILIKE fallback.
+
+    Args:
+        search: Raw search text from the query string
+        dialect_name: Active SQLAlchemy dialect name
+
+    Returns:
+        SQLAlchemy filter expression
+    """
+    if dialect_name == "postgresql":
+        document = func.to_tsvector(
+            "simple",
+            Datasets.question + " " + Datasets.answer,
+        )
+        return document.op("@@")(func.websearch_to_tsquery("simple", search))
+
+    search_pattern = f"%{search}%"
+    return or_(
+        Datasets.question.ilike(search_pattern),
+        Datasets.answer.ilike(search_pattern),
+    )
+
 
 @router.post("/datasets", response_model=DatasetResponse, status_code=status.HTTP_201_CREATED)
 def create_dataset(
@@ -34,39 +125,44 @@ def create_dataset(
     Raises:
         HTTPException: If project not found or dataset creation fails
     """
-    # Verify project exists
-    project = db.query(Projects).filter(Projects.id == dataset.project_id).first()
-    if not project:
+    try:
+        # INSERT ... RETURNING hands back the row with its generated id
+        # and timestamps in one round trip, instead of add + commit + the
+        # re-SELECT that refresh issues
+        db_dataset = db.execute(
+            insert(Datasets)
+            .values(
+                project_id=dataset.project_id,
+                question_id=dataset.question_id,
+                question=dataset.question,
+                answer=dataset.answer,
+                answer_type=dataset.answer_type,
+                chunk_name=dataset.chunk_name,
+                chunk_content=dataset.chunk_content,
+                model=dataset.model,
+                question_label=dataset.question_label,
+                cot=dataset.cot,
+                confirmed=dataset.confirmed,
+                score=dataset.score,
+                ai_evaluation=dataset.ai_evaluation,
+                tags=dataset.tags,
+                note=dataset.note,
+                other=dataset.other,
+            )
+            .returning(Datasets)
+        ).scalar_one()
+        db.commit()
+
+        return DatasetResponse.model_validate(db_dataset)
+    except IntegrityError:
+        # Let the FK constraint police the project reference instead of
+        # a pre-SELECT: the only FK on this insert is project_id, so a
+        # violation means the project doesn't exist
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {dataset.project_id} not found",
         )
-    
-    try:
-        db_dataset = Datasets(
-            project_id=dataset.project_id,
-            question_id=dataset.question_id,
-            question=dataset.question,
-            answer=dataset.answer,
-            answer_type=dataset.answer_type,
-            chunk_name=dataset.chunk_name,
-            chunk_content=dataset.chunk_content,
-            model=dataset.model,
-            question_label=dataset.question_label,
-            cot=dataset.cot,
-            confirmed=dataset.confirmed,
-            score=dataset.score,
-            ai_evaluation=dataset.ai_evaluation,
-            tags=dataset.tags,
-            note=dataset.note,
-            other=dataset.other,
-        )
-        
-        db.add(db_dataset)
-        db.commit()
-        db.refresh(db_dataset)
-        
-        return DatasetResponse.model_validate(db_dataset)
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -82,10 +178,17 @@ def list_datasets(
     min_score: Optional[float] = Query(None, ge=0.0, le=5.0, description="Minimum score filter"),
     tags: Optional[str] = Query(None, description="Filter by tags (comma-separated)"),
     search: Optional[str] = Query(None, description="Search in question or answer text"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (offset mode, deprecated)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(
+        None,
+        description=(
+            "Keyset cursor from the X-Next-Cursor header of the previous "
+            "page; pass an empty string for the first page"
+        ),
+    ),
     db: Session = Depends(get_db),
-) -> List[DatasetResponse]:
+) -> Response:
     """
     List datasets with optional filtering.
     
@@ -102,14 +205,17 @@ def list_datasets(
         min_score: Optional minimum score filter
         tags: Optional tags filter (comma-separated)
         search: Optional search text
-        skip: Number of records to skip
+        skip: Number of records to skip (only honored when no cursor is given)
         limit: Maximum number of records to return
+        cursor: Optional keyset cursor; when present, pagination seeks
+            past the cursor row in (create_at, id) order and the cursor
+            for the next page is returned in the X-Next-Cursor header
         db: Database session
-    
+
     Returns:
         List of dataset entries
     """
-    query = db.query(Datasets)
+    query = db.query(*_DATASET_COLUMNS)
     
     # Apply filters
     if project_id:
@@ -123,55 +229,67 @@ def list_datasets(
     
     if tags:
         # Filter by tags - match if any of the provided tags are present
-        tag_list = [tag.strip() for tag in tags.split(",")]
-        # Use OR condition to match any tag
-        tag_filters = [Datasets.tags.contains(tag) for tag in tag_list]
-        if tag_filters:
-            from sqlalchemy import or_
-            query = query.filter(or_(*tag_filters))
-    
+        tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
+        if tag_list:
+            query = query.filter(
+                _tags_any_filter(tag_list, db.get_bind().dialect.name)
+            )
+
     if search:
         # Search in question or answer text
-        from sqlalchemy import or_
-        search_pattern = f"%{search}%"
         query = query.filter(
-            or_(
-                Datasets.question.ilike(search_pattern),
-                Datasets.answer.ilike(search_pattern)
-            )
+            _search_filter(search, db.get_bind().dialect.name)
         )
     
-    # Apply pagination
-    datasets = query.offset(skip).limit(limit).all()
-    return [DatasetResponse.model_validate(d) for d in datasets]
+    headers = {}
+    if cursor is not None:
+        # Keyset ("seek") pagination: the (create_at, id) tuple filter
+        # lands on an index probe, so page N costs the same as page 1,
+        # where OFFSET scans and discards skip rows first
+        try:
+            datasets = apply_keyset_pagination(
+                query,
+                Datasets,
+                PaginationParams(limit=limit, cursor=cursor, cursor_field="create_at"),
+            ).all()
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Malformed pagination cursor: {cursor}",
+            )
+        if len(datasets) == limit:
+            last = datasets[-1]
+            headers["X-Next-Cursor"] = encode_cursor(last.create_at, last.id)
+    else:
+        # Offset pagination, kept for existing clients
+        datasets = query.offset(skip).limit(limit).all()
+
+    # Validate once and serialize straight to JSON bytes; returning a
+    # Response keeps FastAPI from re-validating through response_model
+    items = _DATASET_LIST_ADAPTER.validate_python(datasets, from_attributes=True)
+    return Response(
+        content=_DATASET_LIST_ADAPTER.dump_json(items),
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 @router.get("/datasets/{dataset_id}", response_model=DatasetResponse)
 def get_dataset(
-    dataset_id: str,
-    db: Session = Depends(get_db),
+    dataset: Datasets = Depends(dataset_or_404),
 ) -> DatasetResponse:
     """
     Get dataset entry details by ID.
-    
+
     Args:
-        dataset_id: Dataset entry ID
-        db: Database session
-    
+        dataset: Dataset entry loaded by the path dependency
+
     Returns:
         Dataset entry details
-    
+
     Raises:
         HTTPException: If dataset entry not found
     """
-    dataset = db.query(Datasets).filter(Datasets.id == dataset_id).first()
-    
-    if not dataset:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Dataset entry with id {dataset_id} not found",
-        )
-    
     return DatasetResponse.model_validate(dataset)
 
 
@@ -183,36 +301,34 @@ def update_dataset(
 ) -> DatasetResponse:
     """
     Update dataset entry details.
-    
+
     Args:
         dataset_id: Dataset entry ID
         dataset_update: Dataset update data
         db: Database session
-    
+
     Returns:
         Updated dataset entry
-    
+
     Raises:
         HTTPException: If dataset entry not found or update fails
     """
-    db_dataset = db.query(Datasets).filter(Datasets.id == dataset_id).first()
-    
-    if not db_dataset:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Dataset entry with id {dataset_id} not found",
-        )
-    
+    # Update only provided fields
+    update_data = dataset_update.model_dump(exclude_unset=True)
+
+    if not update_data:
+        # Nothing to change; return the current row
+        return DatasetResponse.model_validate(dataset_or_404(dataset_id, db))
+
     try:
-        # Update only provided fields
-        update_data = dataset_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_dataset, field, value)
-        
-        db.commit()
-        db.refresh(db_dataset)
-        
-        return DatasetResponse.model_validate(db_dataset)
+        # Single UPDATE ... RETURNING round-trip instead of
+        # SELECT + SET + refresh
+        row = db.execute(
+            update(Datasets)
+            .where(Datasets.id == dataset_id)
+            .values(**update_data)
+            .returning(Datasets)
+        ).scalar_one_or_none()
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -220,34 +336,36 @@ def update_dataset(
             detail=f"Failed to update dataset entry: {str(e)}",
         )
 
+    if row is None:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Dataset entry with id {dataset_id} not found",
+        )
+
+    db.commit()
+    return DatasetResponse.model_validate(row)
+
 
 @router.delete("/datasets/{dataset_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_dataset(
-    dataset_id: str,
+    db_dataset: Datasets = Depends(dataset_or_404),
     db: Session = Depends(get_db),
 ) -> None:
     """
     Delete a dataset entry.
-    
+
     This operation only deletes the dataset entry itself. The source question
     and chunk remain unaffected in the database (Property 20: Dataset entry
     deletion isolation).
-    
+
     Args:
-        dataset_id: Dataset entry ID
+        db_dataset: Dataset entry loaded by the path dependency
         db: Database session
-    
+
     Raises:
         HTTPException: If dataset entry not found or deletion fails
     """
-    db_dataset = db.query(Datasets).filter(Datasets.id == dataset_id).first()
-    
-    if not db_dataset:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Dataset entry with id {dataset_id} not found",
-        )
-    
     try:
         db.delete(db_dataset)
         db.commit()
@@ -6,9 +6,12 @@ This module provides REST API endpoints for file upload and management.
 
 import hashlib
 import os
+import tempfile
 from pathlib import Path
 from typing import List, Optional
 
+import anyio.to_thread
+
 from fastapi import (
     APIRouter,
     Depends,
@@ -16,33 +19,97 @@ from fastapi import (
     Form,
     HTTPException,
     Query,
+    Response,
     UploadFile,
     status,
 )
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from easy_dataset.models import Projects, UploadFiles
+from easy_dataset.models import UploadFiles
 from easy_dataset.schemas import UploadFileCreate, UploadFileResponse
+from easy_dataset.utils.query import (
+    PaginationParams,
+    apply_keyset_pagination,
+    encode_cursor,
+)
 from easy_dataset_server.config import settings
-from easy_dataset_server.dependencies import get_db
+from easy_dataset_server.dependencies import file_or_404, get_db
 
 router = APIRouter()
 
+# Built once at import: validating a whole page through one adapter call
+# stays inside pydantic-core instead of re-entering it per row
+_FILE_LIST_ADAPTER = TypeAdapter(List[UploadFileResponse])
+
+# Upload directories already created by this process. mkdir with
+# exist_ok=True still issues the syscall on every upload; remembering
+# known paths skips it after the first upload to a project. Bounded the
+# same way as the project existence cache: cleared when full
+_ENSURED_DIRS_MAX = 10_000
+_ensured_dirs: set = set()
+
+
+def _ensure_upload_dir(project_id: str) -> Path:
+    """
+    Return the project's upload directory, creating it if needed.
 
-def calculate_md5(file_path: str) -> str:
-    """Calculate MD5 hash of a file.
-    
     Args:
-        file_path: Path to the file
-    
+        project_id: Project ID owning the directory
+
     Returns:
-        MD5 hash as hex string
+        Path of the (existing) upload directory
     """
-    md5_hash = hashlib.md5()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            md5_hash.update(chunk)
-    return md5_hash.hexdigest()
+    upload_dir = Path(settings.upload_dir) / project_id
+    key = str(upload_dir)
+    if key not in _ensured_dirs:
+        upload_dir.mkdir(parents=True, exist_ok=True)
+        if len(_ensured_dirs) >= _ENSURED_DIRS_MAX:
+            _ensured_dirs.clear()
+        _ensured_dirs.add(key)
+    return upload_dir
+
+
+def _blob_is_shared(path: str, db: Session, exclude_id: Optional[str] = None) -> bool:
+    """
+    Check whether another upload record still references a stored blob.
+
+    Content-addressed storage means several records can point at the
+    same on-disk file; the blob may only be unlinked once no record
+    references it.
+
+    Args:
+        path: Stored blob path
+        db: Database session
+        exclude_id: Record being removed, excluded from the check
+
+    Returns:
+        True if some other record references the path
+    """
+    query = db.query(UploadFiles.id).filter(UploadFiles.path == path)
+    if exclude_id is not None:
+        query = query.filter(UploadFiles.id != exclude_id)
+    return query.first() is not None
+
+
+def _discard_upload(tmp_path: Optional[Path], stored_path: Optional[Path], db: Session) -> None:
+    """
+    Clean up the on-disk side of a failed upload.
+
+    Removes the temp file if the upload never reached the blob store,
+    or the published blob if no existing record shares it.
+
+    Args:
+        tmp_path: In-flight temp file, if still present
+        stored_path: Published blob path, if the rename happened
+        db: Database session for the shared-blob check
+    """
+    if tmp_path is not None:
+        tmp_path.unlink(missing_ok=True)
+    elif stored_path is not None and not _blob_is_shared(str(stored_path), db):
+        stored_path.unlink(missing_ok=True)
 
 
 @router.post("/files/upload", response_model=UploadFileResponse, status_code=status.HTTP_201_CREATED)
@@ -61,62 +128,106 @@ async def upload_file(
     
     Returns:
         Uploaded file metadata
-    
+
     Raises:
         HTTPException: If project not found or upload fails
     """
-    # Verify project exists
-    project = db.query(Projects).filter(Projects.id == project_id).first()
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Project with id {project_id} not found",
-        )
-    
-    # Check file size
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset to beginning
-    
-    if file_size > settings.max_upload_size:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File size exceeds maximum allowed size of {settings.max_upload_size} bytes",
-        )
-    
+    # The client-supplied filename is only stored as metadata; dropping
+    # any directory components keeps "../../etc/passwd"-style names from
+    # escaping the upload directory
+    file_name = Path(file.filename).name
+
+    # On-disk storage is content-addressed: the blob lives at
+    # {upload_dir}/{project_id}/{md5[:2]}/{md5}, so re-uploads of the
+    # same content cost no second write and directory fanout is bounded
+    tmp_path: Optional[Path] = None
+    stored_path: Optional[Path] = None
     try:
-        # Create upload directory if it doesn't exist
-        upload_dir = Path(settings.upload_dir) / project_id
-        upload_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Save file
-        file_path = upload_dir / file.filename
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
-        
-        # Calculate MD5
-        md5 = calculate_md5(str(file_path))
-        
-        # Create database record
-        db_file = UploadFiles(
-            project_id=project_id,
-            file_name=file.filename,
-            path=str(file_path),
-            size=file_size,
-            md5=md5,
+        # Create upload directory if it doesn't exist (cached after the
+        # first upload, so repeat uploads skip the mkdir syscall)
+        upload_dir = _ensure_upload_dir(project_id)
+
+        # Stream to a temp file in the target directory while hashing:
+        # the bytes are traversed once, peak memory stays at one chunk,
+        # and the size limit is enforced as data arrives. Disk writes go
+        # through a worker thread so a slow or large upload doesn't
+        # stall the event loop for other requests
+        f = await anyio.to_thread.run_sync(
+            lambda: tempfile.NamedTemporaryFile(dir=upload_dir, delete=False)
         )
-        
-        db.add(db_file)
+        tmp_path = Path(f.name)
+        md5_hash = hashlib.md5()
+        file_size = 0
+        try:
+            while chunk := await file.read(1 << 20):
+                file_size += len(chunk)
+                if file_size > settings.max_upload_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=(
+                            "File size exceeds maximum allowed size of "
+                            f"{settings.max_upload_size} bytes"
+                        ),
+                    )
+                md5_hash.update(chunk)
+                await anyio.to_thread.run_sync(f.write, chunk)
+            # Flush to stable storage before the rename publishes the path
+            await anyio.to_thread.run_sync(f.flush)
+            await anyio.to_thread.run_sync(os.fsync, f.fileno())
+        finally:
+            await anyio.to_thread.run_sync(f.close)
+        md5 = md5_hash.hexdigest()
+
+        def _publish() -> Path:
+            final_dir = upload_dir / md5[:2]
+            final_dir.mkdir(exist_ok=True)
+            final_path = final_dir / md5
+            if final_path.exists():
+                # Same content already on disk: drop the duplicate bytes
+                os.unlink(tmp_path)
+            else:
+                os.rename(tmp_path, final_path)
+            return final_path
+
+        stored_path = await anyio.to_thread.run_sync(_publish)
+        tmp_path = None
+
+        # INSERT ... RETURNING hands back the row with its generated id
+        # and timestamps in one round trip, instead of add + commit + the
+        # re-SELECT that refresh issues
+        db_file = db.execute(
+            insert(UploadFiles)
+            .values(
+                project_id=project_id,
+                file_name=file_name,
+                file_ext=Path(file_name).suffix.lower(),
+                path=str(stored_path),
+                size=file_size,
+                md5=md5,
+            )
+            .returning(UploadFiles)
+        ).scalar_one()
         db.commit()
-        db.refresh(db_file)
-        
+
         return UploadFileResponse.model_validate(db_file)
+    except HTTPException:
+        # Remove the partial file from an aborted (oversized) upload
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        raise
+    except IntegrityError:
+        # The FK constraint polices the project reference instead of a
+        # pre-SELECT; a violation on this insert means a missing project
+        db.rollback()
+        _discard_upload(tmp_path, stored_path, db)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with id {project_id} not found",
+        )
     except Exception as e:
         db.rollback()
         # Clean up file if database operation fails
-        if file_path.exists():
-            file_path.unlink()
+        _discard_upload(tmp_path, stored_path, db)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to upload file: {str(e)}",
@@ -126,89 +237,109 @@ async def upload_file(
 @router.get("/files", response_model=List[UploadFileResponse])
 def list_files(
     project_id: Optional[str] = Query(None, description="Filter by project ID"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (offset mode, deprecated)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(
+        None,
+        description=(
+            "Keyset cursor from the X-Next-Cursor header of the previous "
+            "page; pass an empty string for the first page"
+        ),
+    ),
     db: Session = Depends(get_db),
-) -> List[UploadFileResponse]:
+) -> Response:
     """
     List uploaded files with optional filtering.
-    
+
     Args:
         project_id: Optional project ID filter
-        skip: Number of records to skip
+        skip: Number of records to skip (only honored when no cursor is given)
         limit: Maximum number of records to return
+        cursor: Optional keyset cursor; when present, pagination seeks
+            past the cursor row in (create_at, id) order and the cursor
+            for the next page is returned in the X-Next-Cursor header
         db: Database session
-    
+
     Returns:
         List of uploaded files
     """
     query = db.query(UploadFiles)
-    
+
     if project_id:
         query = query.filter(UploadFiles.project_id == project_id)
-    
-    files = query.offset(skip).limit(limit).all()
-    return [UploadFileResponse.model_validate(f) for f in files]
+
+    headers = {}
+    if cursor is not None:
+        # Keyset ("seek") pagination: constant cost per page regardless
+        # of depth, unlike OFFSET which scans the skipped rows
+        try:
+            files = apply_keyset_pagination(
+                query,
+                UploadFiles,
+                PaginationParams(limit=limit, cursor=cursor, cursor_field="create_at"),
+            ).all()
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Malformed pagination cursor: {cursor}",
+            )
+        if len(files) == limit:
+            last = files[-1]
+            headers["X-Next-Cursor"] = encode_cursor(last.create_at, last.id)
+    else:
+        # Offset pagination, kept for existing clients
+        files = query.offset(skip).limit(limit).all()
+
+    # Validate once and serialize straight to JSON bytes; returning a
+    # Response keeps FastAPI from re-validating through response_model
+    items = _FILE_LIST_ADAPTER.validate_python(files, from_attributes=True)
+    return Response(
+        content=_FILE_LIST_ADAPTER.dump_json(items),
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 @router.get("/files/{file_id}", response_model=UploadFileResponse)
 def get_file(
-    file_id: str,
-    db: Session = Depends(get_db),
+    file: UploadFiles = Depends(file_or_404),
 ) -> UploadFileResponse:
     """
     Get file details by ID.
-    
+
     Args:
-        file_id: File ID
-        db: Database session
-    
+        file: Uploaded file loaded by the path dependency
+
     Returns:
         File details
-    
+
     Raises:
         HTTPException: If file not found
     """
-    file = db.query(UploadFiles).filter(UploadFiles.id == file_id).first()
-    
-    if not file:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"File with id {file_id} not found",
-        )
-    
     return UploadFileResponse.model_validate(file)
 
 
 @router.delete("/files/{file_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_file(
-    file_id: str,
+    db_file: UploadFiles = Depends(file_or_404),
     db: Session = Depends(get_db),
 ) -> None:
     """
     Delete an uploaded file.
-    
+
     Args:
-        file_id: File ID
+        db_file: Uploaded file loaded by the path dependency
         db: Database session
-    
+
     Raises:
         HTTPException: If file not found or deletion fails
     """
-    db_file = db.query(UploadFiles).filter(UploadFiles.id == file_id).first()
-    
-    if not db_file:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"File with id {file_id} not found",
-        )
-    
     try:
-        # Delete physical file
-        file_path = Path(db_file.path)
-        if file_path.exists():
-            file_path.unlink()
-        
+        # Delete the physical blob only when no other record shares it
+        # (uploads are content-addressed, so duplicates map to one file)
+        if not _blob_is_shared(db_file.path, db, exclude_id=db_file.id):
+            Path(db_file.path).unlink(missing_ok=True)
+
         # Delete database record
         db.delete(db_file)
         db.commit()
@@ -7,6 +7,7 @@ This module provides REST API endpoints for project management.
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
 from easy_dataset.models import Projects
@@ -21,7 +22,11 @@ from easy_dataset.utils.query import (
     build_query,
     create_paginated_response,
 )
-from easy_dataset_server.dependencies import get_db
+from easy_dataset_server.dependencies import (
+    get_db,
+    invalidate_project,
+    project_or_404,
+)
 
 router = APIRouter()
 
@@ -45,23 +50,26 @@ def create_project(
         HTTPException: If project creation fails
     """
     try:
-        # Create new project instance
-        db_project = Projects(
-            name=project.name,
-            description=project.description,
-            global_prompt=project.global_prompt or "",
-            question_prompt=project.question_prompt or "",
-            answer_prompt=project.answer_prompt or "",
-            label_prompt=project.label_prompt or "",
-            domain_tree_prompt=project.domain_tree_prompt or "",
-            clean_prompt=project.clean_prompt or "",
-            default_model_config_id=project.default_model_config_id,
-        )
-        
-        db.add(db_project)
+        # INSERT ... RETURNING hands back the row with its generated id
+        # and timestamps in one round trip, instead of add + commit + the
+        # re-SELECT that refresh issues
+        db_project = db.execute(
+            insert(Projects)
+            .values(
+                name=project.name,
+                description=project.description,
+                global_prompt=project.global_prompt or "",
+                question_prompt=project.question_prompt or "",
+                answer_prompt=project.answer_prompt or "",
+                label_prompt=project.label_prompt or "",
+                domain_tree_prompt=project.domain_tree_prompt or "",
+                clean_prompt=project.clean_prompt or "",
+                default_model_config_id=project.default_model_config_id,
+            )
+            .returning(Projects)
+        ).scalar_one()
         db.commit()
-        db.refresh(db_project)
-        
+
         return ProjectResponse.model_validate(db_project)
     except Exception as e:
         db.rollback()
@@ -74,31 +82,48 @@ def create_project(
 @router.get("/projects")
 def list_projects(
     limit: int = Query(50, ge=1, le=1000, description="Number of items per page"),
-    offset: int = Query(0, ge=0, description="Number of items to skip"),
+    offset: int = Query(0, ge=0, description="Number of items to skip (offset mode, deprecated)"),
     sort_by: Optional[str] = Query(None, description="Field to sort by"),
     sort_order: str = Query("asc", description="Sort order: asc or desc"),
     search: Optional[str] = Query(None, description="Search term"),
     name: Optional[str] = Query(None, description="Filter by name"),
+    cursor: Optional[str] = Query(
+        None,
+        description=(
+            "Keyset cursor from the next_cursor field of the previous "
+            "page; pass an empty string for the first page"
+        ),
+    ),
     db: Session = Depends(get_db),
 ) -> Dict[str, Any]:
     """
     List all projects with pagination, filtering, and sorting.
-    
+
     Args:
         limit: Number of items per page
-        offset: Number of items to skip
+        offset: Number of items to skip (only honored when no cursor is given)
         sort_by: Field to sort by (name, create_at, update_at)
         sort_order: Sort order (asc or desc)
         search: Search term (searches in name and description)
         name: Filter by exact name match
+        cursor: Optional keyset cursor; when present, pages are served
+            in (create_at, id) order via an index seek (sort_by is
+            ignored) and the response carries next_cursor for the
+            following page
         db: Database session
-    
+
     Returns:
         Paginated list of projects with metadata
     """
-    # Create pagination and sort params
-    pagination = PaginationParams(limit=limit, offset=offset)
-    sort_params = SortParams(sort_by=sort_by, sort_order=sort_order)
+    # Create pagination and sort params; a cursor switches pagination
+    # into keyset mode over (create_at, id), which fixes the ordering
+    pagination = PaginationParams(
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        cursor_field="create_at" if cursor is not None else None,
+    )
+    sort_params = SortParams(sort_by=sort_by, sort_order=sort_order) if cursor is None else None
     
     # Build filters
     filters = {}
@@ -125,35 +150,31 @@ def list_projects(
     )
     
     # Create paginated response
-    return create_paginated_response(query, pagination, ProjectResponse)
+    try:
+        return create_paginated_response(query, pagination, ProjectResponse)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Malformed pagination cursor: {cursor}",
+        )
 
 
 @router.get("/projects/{project_id}", response_model=ProjectResponse)
 def get_project(
-    project_id: str,
-    db: Session = Depends(get_db),
+    project: Projects = Depends(project_or_404),
 ) -> ProjectResponse:
     """
     Get project details by ID.
-    
+
     Args:
-        project_id: Project ID
-        db: Database session
-    
+        project: Project loaded by the path dependency
+
     Returns:
         Project details
-    
+
     Raises:
         HTTPException: If project not found
     """
-    project = db.query(Projects).filter(Projects.id == project_id).first()
-    
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Project with id {project_id} not found",
-        )
-    
     return ProjectResponse.model_validate(project)
 
 
@@ -165,36 +186,34 @@ def update_project(
 ) -> ProjectResponse:
     """
     Update project details.
-    
+
     Args:
         project_id: Project ID
         project_update: Project update data
         db: Database session
-    
+
     Returns:
         Updated project
-    
+
     Raises:
         HTTPException: If project not found or update fails
     """
-    db_project = db.query(Projects).filter(Projects.id == project_id).first()
-    
-    if not db_project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Project with id {project_id} not found",
-        )
-    
+    # Update only provided fields
+    update_data = project_update.model_dump(exclude_unset=True)
+
+    if not update_data:
+        # Nothing to change; return the current row
+        return ProjectResponse.model_validate(project_or_404(project_id, db))
+
     try:
-        # Update only provided fields
-        update_data = project_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_project, field, value)
-        
-        db.commit()
-        db.refresh(db_project)
-        
-        return ProjectResponse.model_validate(db_project)
+        # Single UPDATE ... RETURNING round-trip instead of
+        # SELECT + SET + refresh
+        row = db.execute(
+            update(Projects)
+            .where(Projects.id == project_id)
+            .values(**update_data)
+            .returning(Projects)
+        ).scalar_one_or_none()
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -202,33 +221,40 @@ def update_project(
             detail=f"Failed to update project: {str(e)}",
         )
 
+    if row is None:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with id {project_id} not found",
+        )
+
+    db.commit()
+    return ProjectResponse.model_validate(row)
+
 
 @router.delete("/projects/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_project(
     project_id: str,
+    db_project: Projects = Depends(project_or_404),
     db: Session = Depends(get_db),
 ) -> None:
     """
     Delete a project.
-    
+
     Args:
         project_id: Project ID
+        db_project: Project loaded by the path dependency
         db: Database session
-    
+
     Raises:
         HTTPException: If project not found or deletion fails
     """
-    db_project = db.query(Projects).filter(Projects.id == project_id).first()
-    
-    if not db_project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Project with id {project_id} not found",
-        )
-    
     try:
         db.delete(db_project)
         db.commit()
+        # Drop the id from the existence cache so create paths can't
+        # keep validating against the deleted project until the TTL
+        invalidate_project(project_id)
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -6,15 +6,49 @@ This module provides REST API endpoints for question management.
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from easy_dataset.models import Chunks, Projects, Questions
+from easy_dataset.models import Chunks, Questions
 from easy_dataset.schemas import QuestionCreate, QuestionResponse, QuestionUpdate
-from easy_dataset_server.dependencies import get_db
+from easy_dataset.utils.query import (
+    PaginationParams,
+    apply_keyset_pagination,
+    encode_cursor,
+)
+from easy_dataset_server.dependencies import (
+    get_db,
+    missing_projects,
+    project_exists,
+    question_or_404,
+)
 
 router = APIRouter()
 
+# Built once at import: validating a whole page through one adapter call
+# stays inside pydantic-core instead of re-entering it per row
+_QUESTION_LIST_ADAPTER = TypeAdapter(List[QuestionResponse])
+
+# Columns matching QuestionResponse, selected as plain rows so the list
+# endpoint skips ORM instance materialization and identity-map entries
+_QUESTION_COLUMNS = (
+    Questions.id,
+    Questions.project_id,
+    Questions.chunk_id,
+    Questions.ga_pair_id,
+    Questions.question,
+    Questions.label,
+    Questions.answered,
+    Questions.image_id,
+    Questions.image_name,
+    Questions.template_id,
+    Questions.create_at,
+    Questions.update_at,
+)
+
 
 @router.post("/questions", response_model=QuestionResponse, status_code=status.HTTP_201_CREATED)
 def create_question(
@@ -34,43 +68,141 @@ def create_question(
     Raises:
         HTTPException: If project or chunk not found or question creation fails
     """
-    # Verify project exists
-    project = db.query(Projects).filter(Projects.id == question.project_id).first()
-    if not project:
+    try:
+        # Single INSERT ... RETURNING round trip: the FK constraints
+        # police the project/chunk references instead of two pre-SELECTs,
+        # and RETURNING replaces the re-SELECT that refresh issues
+        db_question = db.execute(
+            insert(Questions)
+            .values(
+                project_id=question.project_id,
+                chunk_id=question.chunk_id,
+                question=question.question,
+                label=question.label or "",
+                answered=question.answered or False,
+                ga_pair_id=question.ga_pair_id,
+            )
+            .returning(Questions)
+        ).scalar_one()
+        db.commit()
+
+        return QuestionResponse.model_validate(db_question)
+    except IntegrityError:
+        # SQLite reports a bare "FOREIGN KEY constraint failed" without
+        # naming the constraint, so resolve which reference was missing
+        # on this (cold) error path
+        db.rollback()
+        if not project_exists(question.project_id, db):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project with id {question.project_id} not found",
+            )
+        if (
+            question.chunk_id
+            and db.execute(
+                select(Chunks.id).where(Chunks.id == question.chunk_id)
+            ).first() is None
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Chunk with id {question.chunk_id} not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Project with id {question.project_id} not found",
+            detail=f"GA pair with id {question.ga_pair_id} not found",
         )
-    
-    # Verify chunk exists if provided
-    if question.chunk_id:
-        chunk = db.query(Chunks).filter(Chunks.id == question.chunk_id).first()
-        if not chunk:
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create question: {str(e)}",
+        )
+
+
+@router.post(
+    "/questions/batch",
+    response_model=List[QuestionResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+def create_questions_batch(
+    questions: List[QuestionCreate],
+    db: Session = Depends(get_db),
+) -> List[QuestionResponse]:
+    """
+    Create many questions in a single statement.
+
+    LLM generation flows produce dozens of questions per chunk; posting
+    them through the single-row endpoint costs one round trip each.
+    This endpoint validates all referenced projects and chunks with one
+    SELECT apiece, then inserts every row through the dialect's
+    multi-values INSERT.
+
+    Args:
+        questions: Question creation payloads
+        db: Database session
+
+    Returns:
+        Created questions, in input order
+
+    Raises:
+        HTTPException: If any referenced project or chunk is missing or
+            the insert fails
+    """
+    if not questions:
+        return []
+
+    # Verify all referenced projects exist (cached ids skip the SELECT,
+    # the rest are checked with one query)
+    missing = missing_projects({q.project_id for q in questions}, db)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with id {sorted(missing)[0]} not found",
+        )
+
+    # Verify all referenced chunks exist with one IN query
+    chunk_ids = {q.chunk_id for q in questions if q.chunk_id}
+    if chunk_ids:
+        found = set(
+            db.execute(
+                select(Chunks.id).where(Chunks.id.in_(chunk_ids))
+            ).scalars()
+        )
+        missing_chunks = chunk_ids - found
+        if missing_chunks:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Chunk with id {question.chunk_id} not found",
+                detail=f"Chunk with id {sorted(missing_chunks)[0]} not found",
             )
-    
+
+    rows = [
+        {
+            "project_id": q.project_id,
+            "chunk_id": q.chunk_id,
+            "question": q.question,
+            "label": q.label or "",
+            "answered": q.answered or False,
+            "ga_pair_id": q.ga_pair_id,
+            "image_id": q.image_id,
+            "image_name": q.image_name,
+            "template_id": q.template_id,
+        }
+        for q in questions
+    ]
+
     try:
-        db_question = Questions(
-            project_id=question.project_id,
-            chunk_id=question.chunk_id,
-            question=question.question,
-            label=question.label or "",
-            answered=question.answered or False,
-            ga_pair_id=question.ga_pair_id,
-        )
-        
-        db.add(db_question)
+        # executemany with RETURNING: the engine pages rows through
+        # multi-values INSERTs (insertmanyvalues) in a single commit
+        created = db.execute(
+            insert(Questions).returning(*_QUESTION_COLUMNS), rows
+        ).mappings().all()
         db.commit()
-        db.refresh(db_question)
-        
-        return QuestionResponse.model_validate(db_question)
+        return [QuestionResponse.model_construct(**row) for row in created]
     except Exception as e:
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create question: {str(e)}",
+            detail=f"Failed to create questions: {str(e)}",
         )
 
 
@@ -79,63 +211,91 @@ def list_questions(
     project_id: Optional[str] = Query(None, description="Filter by project ID"),
     chunk_id: Optional[str] = Query(None, description="Filter by chunk ID"),
     answered: Optional[bool] = Query(None, description="Filter by answered status"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (offset mode, deprecated)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(
+        None,
+        description=(
+            "Keyset cursor from the X-Next-Cursor header of the previous "
+            "page; pass an empty string for the first page"
+        ),
+    ),
     db: Session = Depends(get_db),
-) -> List[QuestionResponse]:
+) -> Response:
     """
     List questions with optional filtering.
-    
+
     Args:
         project_id: Optional project ID filter
         chunk_id: Optional chunk ID filter
         answered: Optional answered status filter
-        skip: Number of records to skip
+        skip: Number of records to skip (only honored when no cursor is given)
         limit: Maximum number of records to return
+        cursor: Optional keyset cursor; when present, pagination seeks
+            past the cursor row in (create_at, id) order and the cursor
+            for the next page is returned in the X-Next-Cursor header
         db: Database session
-    
+
     Returns:
         List of questions
     """
-    query = db.query(Questions)
-    
+    query = db.query(*_QUESTION_COLUMNS)
+
     if project_id:
         query = query.filter(Questions.project_id == project_id)
     if chunk_id:
         query = query.filter(Questions.chunk_id == chunk_id)
     if answered is not None:
         query = query.filter(Questions.answered == answered)
-    
-    questions = query.offset(skip).limit(limit).all()
-    return [QuestionResponse.model_validate(q) for q in questions]
+
+    headers = {}
+    if cursor is not None:
+        # Keyset ("seek") pagination: constant cost per page regardless
+        # of depth, unlike OFFSET which scans the skipped rows
+        try:
+            questions = apply_keyset_pagination(
+                query,
+                Questions,
+                PaginationParams(limit=limit, cursor=cursor, cursor_field="create_at"),
+            ).all()
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Malformed pagination cursor: {cursor}",
+            )
+        if len(questions) == limit:
+            last = questions[-1]
+            headers["X-Next-Cursor"] = encode_cursor(last.create_at, last.id)
+    else:
+        # Offset pagination, kept for existing clients
+        questions = query.offset(skip).limit(limit).all()
+
+    # Validate once and serialize straight to JSON bytes; returning a
+    # Response keeps FastAPI from re-validating through response_model
+    items = _QUESTION_LIST_ADAPTER.validate_python(questions, from_attributes=True)
+    return Response(
+        content=_QUESTION_LIST_ADAPTER.dump_json(items),
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 @router.get("/questions/{question_id}", response_model=QuestionResponse)
 def get_question(
-    question_id: str,
-    db: Session = Depends(get_db),
+    question: Questions = Depends(question_or_404),
 ) -> QuestionResponse:
     """
     Get question details by ID.
-    
+
     Args:
-        question_id: Question ID
-        db: Database session
-    
+        question: Question loaded by the path dependency
+
     Returns:
         Question details
-    
+
     Raises:
         HTTPException: If question not found
     """
-    question = db.query(Questions).filter(Questions.id == question_id).first()
-    
-    if not question:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Question with id {question_id} not found",
-        )
-    
     return QuestionResponse.model_validate(question)
 
 
@@ -147,36 +307,34 @@ def update_question(
 ) -> QuestionResponse:
     """
     Update question details.
-    
+
     Args:
         question_id: Question ID
         question_update: Question update data
         db: Database session
-    
+
     Returns:
         Updated question
-    
+
     Raises:
         HTTPException: If question not found or update fails
     """
-    db_question = db.query(Questions).filter(Questions.id == question_id).first()
-    
-    if not db_question:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Question with id {question_id} not found",
-        )
-    
+    # Update only provided fields
+    update_data = question_update.model_dump(exclude_unset=True)
+
+    if not update_data:
+        # Nothing to change; return the current row
+        return QuestionResponse.model_validate(question_or_404(question_id, db))
+
     try:
-        # Update only provided fields
-        update_data = question_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_question, field, value)
-        
-        db.commit()
-        db.refresh(db_question)
-        
-        return QuestionResponse.model_validate(db_question)
+        # Single UPDATE ... RETURNING round-trip instead of
+        # SELECT + SET + refresh
+        row = db.execute(
+            update(Questions)
+            .where(Questions.id == question_id)
+            .values(**update_data)
+            .returning(Questions)
+        ).scalar_one_or_none()
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -184,6 +342,16 @@ def update_question(
             detail=f"Failed to update question: {str(e)}",
         )
 
+    if row is None:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Question with id {question_id} not found",
+        )
+
+    db.commit()
+    return QuestionResponse.model_validate(row)
+
 
 @router.delete("/questions/{question_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_question(
@@ -192,25 +360,22 @@ def delete_question(
 ) -> None:
     """
     Delete a question.
-    
+
     Args:
         question_id: Question ID
         db: Database session
-    
+
     Raises:
         HTTPException: If question not found or deletion fails
     """
-    db_question = db.query(Questions).filter(Questions.id == question_id).first()
-    
-    if not db_question:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Question with id {question_id} not found",
-        )
-    
     try:
-        db.delete(db_question)
-        db.commit()
+        # Set-based delete: one statement instead of loading the row
+        # first; RETURNING distinguishes not-found from deleted
+        deleted_id = db.execute(
+            delete(Questions)
+            .where(Questions.id == question_id)
+            .returning(Questions.id)
+        ).scalar_one_or_none()
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -218,3 +383,12 @@ def delete_question(
             detail=f"Failed to delete question: {str(e)}",
         )
 
+    if deleted_id is None:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Question with id {question_id} not found",
+        )
+
+    db.commit()
+
@@ -2,12 +2,14 @@
 API endpoints for backend updates.
 """
 
+import asyncio
 import logging
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from easy_dataset.utils.updater import (
     BackendUpdater,
@@ -15,15 +17,49 @@ from easy_dataset.utils.updater import (
     download_backend_update,
     install_backend_update,
 )
+from easy_dataset_server.config import settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Update checks hit the GitHub API; polling clients would burn its rate
+# limit and pay its network latency on every call. Releases appear
+# rarely, so the result is memoized per version for a few minutes. The
+# version key comes from the client, so the cache is bounded and
+# cleared when full — legitimate use only ever needs a few entries
+_UPDATE_CHECK_TTL = 300  # seconds
+_UPDATE_CHECK_CACHE_MAX = 16
+_update_check_cache: Dict[str, Tuple[float, Optional[dict]]] = {}
+
+
+def _cached_update_check(current_version: str) -> Optional[dict]:
+    """
+    Check for updates, caching the answer for _UPDATE_CHECK_TTL seconds.
+
+    Args:
+        current_version: Version to compare releases against
+
+    Returns:
+        Update info dict, or None when no newer release exists
+    """
+    now = time.monotonic()
+    cached = _update_check_cache.get(current_version)
+    if cached is not None and now - cached[0] < _UPDATE_CHECK_TTL:
+        return cached[1]
+
+    update_info = check_for_backend_updates(current_version)
+    if len(_update_check_cache) >= _UPDATE_CHECK_CACHE_MAX:
+        _update_check_cache.clear()
+    _update_check_cache[current_version] = (now, update_info)
+    return update_info
+
 
 class UpdateCheckResponse(BaseModel):
     """Response model for update check."""
 
+    model_config = ConfigDict(cache_strings=True)
+
     update_available: bool
     current_version: str
     latest_version: Optional[str] = None
@@ -73,7 +109,7 @@ async def check_updates(current_version: str = "2.0.0") -> UpdateCheckResponse:
     try:
         logger.info(f"Checking for updates (current version: {current_version})")
 
-        update_info = check_for_backend_updates(current_version)
+        update_info = _cached_update_check(current_version)
 
         if update_info:
             return UpdateCheckResponse(
@@ -116,8 +152,12 @@ async def download_update(
     try:
         logger.info(f"Downloading update from {request.download_url}")
 
-        # Download in background
-        update_file = download_backend_update(request.download_url)
+        # The download is blocking network + disk I/O that can run for
+        # minutes; run it on a worker thread so the event loop keeps
+        # serving other requests meanwhile
+        update_file = await asyncio.to_thread(
+            download_backend_update, request.download_url
+        )
 
         if update_file:
             return UpdateDownloadResponse(
@@ -162,7 +202,8 @@ async def install_update(request: UpdateInstallRequest) -> UpdateInstallResponse
                 detail="Update file not found",
             )
 
-        success = install_backend_update(update_file)
+        # Zip extraction and file copying block; keep them off the loop
+        success = await asyncio.to_thread(install_backend_update, update_file)
 
         if success:
             return UpdateInstallResponse(
@@ -185,6 +226,14 @@ async def install_update(request: UpdateInstallRequest) -> UpdateInstallResponse
         )
 
 
+# Version info is fixed at process start; build the response dict once
+# instead of importing settings and assembling it per request
+_VERSION_INFO = {
+    "version": settings.app_version,
+    "name": settings.app_name,
+}
+
+
 @router.get("/version")
 async def get_version() -> dict:
     """Get current backend version.
@@ -192,9 +241,4 @@ async def get_version() -> dict:
     Returns:
         Version information
     """
-    from easy_dataset_server.config import settings
-
-    return {
-        "version": settings.app_version,
-        "name": settings.app_name,
-    }
+    return _VERSION_INFO
@@ -6,15 +6,19 @@ with the frontend, supporting LLM streaming and task progress updates.
 """
 
 import asyncio
-import json
 import logging
 from typing import Any, Dict, Optional
 
+import orjson
+
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from easy_dataset.database.connection import get_db
-from easy_dataset.models.task import Task, TaskStatus
+from easy_dataset.models.task import Task
+from easy_dataset.schemas.task import TaskStatus
+from easy_dataset.services.task_service import register_task_change_listener
+from easy_dataset_server.dependencies import get_db
 from easy_dataset.llm.service import LLMService
 
 logger = logging.getLogger(__name__)
@@ -28,7 +32,8 @@ class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
         self.task_subscribers: Dict[str, set[str]] = {}  # task_id -> set of connection_ids
-    
+        self.task_events: Dict[str, asyncio.Event] = {}  # task_id -> change signal
+
     async def connect(self, websocket: WebSocket, connection_id: str):
         """Accept and store a new WebSocket connection."""
         await websocket.accept()
@@ -47,22 +52,37 @@ class ConnectionManager:
                 subscribers.remove(connection_id)
                 if not subscribers:
                     del self.task_subscribers[task_id]
-    
+                    self.task_events.pop(task_id, None)
+
     def subscribe_to_task(self, connection_id: str, task_id: str):
         """Subscribe a connection to task updates."""
         if task_id not in self.task_subscribers:
             self.task_subscribers[task_id] = set()
         self.task_subscribers[task_id].add(connection_id)
         logger.debug(f"Connection {connection_id} subscribed to task {task_id}")
-    
+
     def unsubscribe_from_task(self, connection_id: str, task_id: str):
         """Unsubscribe a connection from task updates."""
         if task_id in self.task_subscribers:
             self.task_subscribers[task_id].discard(connection_id)
             if not self.task_subscribers[task_id]:
                 del self.task_subscribers[task_id]
+                self.task_events.pop(task_id, None)
             logger.debug(f"Connection {connection_id} unsubscribed from task {task_id}")
-    
+
+    def get_task_event(self, task_id: str) -> asyncio.Event:
+        """Get (or create) the change-notification event for a task."""
+        event = self.task_events.get(task_id)
+        if event is None:
+            event = self.task_events[task_id] = asyncio.Event()
+        return event
+
+    def notify_task_change(self, task_id: str):
+        """Wake subscribers waiting on a task's change event."""
+        event = self.task_events.get(task_id)
+        if event is not None:
+            event.set()
+
     async def send_personal_message(self, message: Dict[str, Any], connection_id: str):
         """Send a message to a specific connection."""
         if connection_id in self.active_connections:
@@ -74,23 +94,74 @@ class ConnectionManager:
     
     async def broadcast_task_update(self, task_id: str, message: Dict[str, Any]):
         """Broadcast a task update to all subscribed connections."""
-        if task_id in self.task_subscribers:
-            disconnected = []
-            for connection_id in self.task_subscribers[task_id]:
-                try:
-                    await self.send_personal_message(message, connection_id)
-                except Exception as e:
-                    logger.error(f"Error broadcasting to {connection_id}: {e}")
-                    disconnected.append(connection_id)
-            
-            # Clean up disconnected connections
-            for connection_id in disconnected:
+        subscribers = self.task_subscribers.get(task_id)
+        if not subscribers:
+            return
+
+        # Serialize once for every subscriber, then fan out concurrently:
+        # awaiting sends one at a time would let a single slow client
+        # stall delivery to everyone behind it
+        payload = _json_text(message)
+        targets = [
+            (connection_id, self.active_connections[connection_id])
+            for connection_id in list(subscribers)
+            if connection_id in self.active_connections
+        ]
+        results = await asyncio.gather(
+            *(websocket.send_text(payload) for _, websocket in targets),
+            return_exceptions=True,
+        )
+
+        # Clean up connections whose send failed
+        for (connection_id, _), result in zip(targets, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error broadcasting to {connection_id}: {result}")
                 self.disconnect(connection_id)
 
 
 # Global connection manager instance
 manager = ConnectionManager()
 
+# Producer side of the per-task change events: TaskService invokes this
+# whenever it records progress or a status transition, waking progress
+# subscribers immediately instead of on the fallback timeout
+register_task_change_listener(manager.notify_task_change)
+
+
+def _json_text(message: Dict[str, Any]) -> str:
+    """Serialize a websocket payload with orjson, as a text frame."""
+    return orjson.dumps(message).decode()
+
+
+# The stream terminator never changes; serialize it once at import so
+# the per-token hot loop ends without a final dumps call
+_STREAM_DONE = _json_text({"type": "chunk", "content": "", "done": True})
+
+
+def _progress_message(
+    task_id: str,
+    task_status: int,
+    completed_count: Optional[int],
+    total_count: Optional[int],
+    note: Optional[str],
+) -> Dict[str, Any]:
+    """Build the progress payload from a task's progress columns."""
+    try:
+        status_name = TaskStatus(task_status).name.lower()
+    except ValueError:
+        status_name = "unknown"
+    completed = completed_count or 0
+    total = total_count or 0
+    return {
+        "type": "progress",
+        "task_id": task_id,
+        "status": status_name,
+        "progress": (completed / total) * 100 if total else 0.0,
+        "current_count": completed,
+        "total_count": total,
+        "message": note or "",
+    }
+
 
 @router.websocket("/ws/llm-stream")
 async def llm_stream_endpoint(
@@ -146,28 +217,45 @@ async def llm_stream_endpoint(
                     }
                     
                     if stream:
-                        # Stream response
+                        # Stream response, coalescing tokens: one frame
+                        # per token costs a serialization and a syscall
+                        # (plus a TLS record on wss) each. Buffering to
+                        # ~256 bytes or ~20 ms cuts frame count an order
+                        # of magnitude with no perceptible latency
+                        loop = asyncio.get_running_loop()
+                        buf: list[str] = []
+                        buf_bytes = 0
+                        last_flush = loop.time()
                         async for chunk in llm_service.chat_stream(config, messages):
-                            await websocket.send_json({
+                            buf.append(chunk)
+                            buf_bytes += len(chunk)
+                            now = loop.time()
+                            if buf_bytes >= 256 or now - last_flush >= 0.02:
+                                await websocket.send_text(_json_text({
+                                    "type": "chunk",
+                                    "content": "".join(buf),
+                                    "done": False
+                                }))
+                                buf.clear()
+                                buf_bytes = 0
+                                last_flush = now
+                        if buf:
+                            await websocket.send_text(_json_text({
                                 "type": "chunk",
-                                "content": chunk,
+                                "content": "".join(buf),
                                 "done": False
-                            })
-                        
-                        # Send completion message
-                        await websocket.send_json({
-                            "type": "chunk",
-                            "content": "",
-                            "done": True
-                        })
+                            }))
+
+                        # Send completion message (pre-serialized)
+                        await websocket.send_text(_STREAM_DONE)
                     else:
                         # Non-streaming response
                         response = await llm_service.chat(config, messages)
-                        await websocket.send_json({
+                        await websocket.send_text(_json_text({
                             "type": "response",
                             "content": response.get("content", ""),
                             "done": True
-                        })
+                        }))
                 
                 except Exception as e:
                     logger.error(f"Error in LLM generation: {e}", exc_info=True)
@@ -214,58 +302,73 @@ async def task_progress_endpoint(
     await manager.connect(websocket, connection_id)
     manager.subscribe_to_task(connection_id, task_id)
     
+    # Re-reads fetch only the columns the payload needs; unlike
+    # db.refresh on the ORM instance this skips re-hydrating the full
+    # row (and any relationship loads refresh could cascade)
+    progress_stmt = select(
+        Task.status, Task.completed_count, Task.total_count, Task.note
+    ).where(Task.id == task_id)
+
     try:
         # Send initial task status
-        task = db.query(Task).filter(Task.id == task_id).first()
-        if task:
-            await websocket.send_json({
-                "type": "progress",
-                "task_id": task.id,
-                "status": task.status.value if task.status else "unknown",
-                "progress": task.progress or 0,
-                "current_count": task.current_count or 0,
-                "total_count": task.total_count or 0,
-                "message": task.note or ""
-            })
+        row = db.execute(progress_stmt).one_or_none()
+        if row:
+            await websocket.send_json(
+                _progress_message(
+                    task_id, row.status, row.completed_count, row.total_count, row.note
+                )
+            )
         else:
             await websocket.send_json({
                 "type": "error",
                 "message": f"Task {task_id} not found"
             })
             return
-        
-        # Keep connection alive and poll for updates
-        last_progress = task.progress
-        last_status = task.status
-        
+
+        # Event-driven updates: workers signal the task's event (via
+        # broadcast_task_update) when progress changes, so the DB is
+        # re-read O(changes) times instead of once per second per
+        # subscriber. The timeout is a safety net that re-checks the
+        # row in case a worker finished without signaling
+        last_progress = row.completed_count
+        last_status = row.status
+        change_event = manager.get_task_event(task_id)
+
         while True:
-            # Wait for a short period
-            await asyncio.sleep(1)
-            
+            # Wait for a change notification (or the fallback timeout)
+            try:
+                await asyncio.wait_for(change_event.wait(), timeout=30)
+            except asyncio.TimeoutError:
+                pass
+            change_event.clear()
+
             # Check for updates
-            db.refresh(task)
-            
+            row = db.execute(progress_stmt).one_or_none()
+            if row is None:
+                # Task row deleted while subscribed; nothing left to report
+                break
+
             # Send update if changed
-            if task.progress != last_progress or task.status != last_status:
-                await websocket.send_json({
-                    "type": "progress",
-                    "task_id": task.id,
-                    "status": task.status.value if task.status else "unknown",
-                    "progress": task.progress or 0,
-                    "current_count": task.current_count or 0,
-                    "total_count": task.total_count or 0,
-                    "message": task.note or ""
-                })
-                
-                last_progress = task.progress
-                last_status = task.status
-            
+            if row.completed_count != last_progress or row.status != last_status:
+                await websocket.send_json(
+                    _progress_message(
+                        task_id,
+                        row.status,
+                        row.completed_count,
+                        row.total_count,
+                        row.note,
+                    )
+                )
+
+                last_progress = row.completed_count
+                last_status = row.status
+
             # Close connection if task is complete or failed
-            if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELED]:
+            if row.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.INTERRUPTED):
                 await websocket.send_json({
                     "type": "complete",
-                    "task_id": task.id,
-                    "status": task.status.value,
+                    "task_id": task_id,
+                    "status": TaskStatus(row.status).name.lower(),
                     "message": "Task finished"
                 })
                 break
@@ -288,4 +391,7 @@ async def broadcast_task_update(task_id: str, task_data: Dict[str, Any]):
         "type": "progress",
         **task_data
     }
+    # Wake progress subscribers so they re-read the task row now rather
+    # than on the fallback timeout
+    manager.notify_task_change(task_id)
     await manager.broadcast_task_update(task_id, message)
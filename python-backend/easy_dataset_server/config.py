@@ -21,11 +21,15 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///easy_dataset.db"
     
-    # CORS
-    cors_origins: List[str] = ["*"]
+    # CORS. Explicit lists instead of "*": wildcard origins are invalid
+    # with credentials (the middleware must echo and revalidate the
+    # Origin per request), and enumerated methods/headers let preflight
+    # checks resolve against precomputed sets. Deployments serving other
+    # frontends override these via the environment
+    cors_origins: List[str] = ["http://localhost:3000"]
     cors_allow_credentials: bool = True
-    cors_allow_methods: List[str] = ["*"]
-    cors_allow_headers: List[str] = ["*"]
+    cors_allow_methods: List[str] = ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
+    cors_allow_headers: List[str] = ["authorization", "content-type", "x-request-id"]
     
     # Logging
     log_level: str = "INFO"
@@ -37,6 +41,10 @@ class Settings(BaseSettings):
     # Task processing
     max_concurrent_tasks: int = 5
     task_timeout: int = 3600  # 1 hour
+
+    # Worker threads for sync endpoints (anyio's default of 40 caps
+    # in-flight requests; DB reads are short so more threads are cheap)
+    sync_thread_pool_size: int = 100
     
     class Config:
         env_file = ".env"
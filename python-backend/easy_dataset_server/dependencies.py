@@ -4,11 +4,23 @@ FastAPI dependencies.
 This module provides dependency injection functions for FastAPI routes.
 """
 
-from typing import Generator
+import time
+from typing import Generator, Iterable, Set
 
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from easy_dataset.database.connection import get_session
+from easy_dataset.models import Datasets, Projects, Questions, UploadFiles
+
+# Positive TTL cache of verified project ids. Projects change rarely,
+# so hot create paths (chunks, questions) can skip the existence SELECT
+# for recently seen projects. Only confirmed hits are cached; misses
+# always go to the database, and deletes evict their entry
+_PROJECT_TTL_SECONDS = 60.0
+_PROJECT_CACHE_MAX = 10_000
+_verified_projects: dict = {}
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -33,3 +45,127 @@ def get_db() -> Generator[Session, None, None]:
     """
     yield from get_session()
 
+
+# Fetch-or-404 dependencies: each loads the row named by its path
+# parameter through Session.get (identity-map fast path, compiled-cache
+# SELECT) and raises the endpoint's 404 when it is missing, replacing
+# the same boilerplate repeated across handlers
+
+
+def project_or_404(project_id: str, db: Session = Depends(get_db)) -> Projects:
+    """Load the project named by the path or raise 404."""
+    project = db.get(Projects, project_id)
+    if project is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with id {project_id} not found",
+        )
+    return project
+
+
+def dataset_or_404(dataset_id: str, db: Session = Depends(get_db)) -> Datasets:
+    """Load the dataset entry named by the path or raise 404."""
+    dataset = db.get(Datasets, dataset_id)
+    if dataset is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Dataset entry with id {dataset_id} not found",
+        )
+    return dataset
+
+
+def file_or_404(file_id: str, db: Session = Depends(get_db)) -> UploadFiles:
+    """Load the uploaded file named by the path or raise 404."""
+    file = db.get(UploadFiles, file_id)
+    if file is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"File with id {file_id} not found",
+        )
+    return file
+
+
+def question_or_404(question_id: str, db: Session = Depends(get_db)) -> Questions:
+    """Load the question named by the path or raise 404."""
+    question = db.get(Questions, question_id)
+    if question is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Question with id {question_id} not found",
+        )
+    return question
+
+
+def _cache_verified_project(project_id: str) -> None:
+    """Record a confirmed project id, bounding the cache size."""
+    if len(_verified_projects) >= _PROJECT_CACHE_MAX:
+        _verified_projects.clear()
+    _verified_projects[project_id] = time.monotonic() + _PROJECT_TTL_SECONDS
+
+
+def project_exists(project_id: str, db: Session) -> bool:
+    """
+    Check that a project exists, serving hot ids from the TTL cache.
+
+    Args:
+        project_id: Project ID to verify
+        db: Database session for the fallback SELECT
+
+    Returns:
+        True if the project exists
+    """
+    expires = _verified_projects.get(project_id)
+    if expires is not None and expires > time.monotonic():
+        return True
+
+    found = db.execute(
+        select(Projects.id).where(Projects.id == project_id)
+    ).first() is not None
+    if found:
+        _cache_verified_project(project_id)
+    return found
+
+
+def missing_projects(project_ids: Iterable[str], db: Session) -> Set[str]:
+    """
+    Return the subset of project ids that do not exist.
+
+    Cached ids are skipped; the rest are verified with one IN SELECT.
+
+    Args:
+        project_ids: Project IDs to verify
+        db: Database session for the fallback SELECT
+
+    Returns:
+        Set of ids with no matching project
+    """
+    now = time.monotonic()
+    unverified = {
+        pid for pid in project_ids
+        if _verified_projects.get(pid, 0.0) <= now
+    }
+    if not unverified:
+        return set()
+
+    found = set(
+        db.execute(
+            select(Projects.id).where(Projects.id.in_(unverified))
+        ).scalars()
+    )
+    for pid in found:
+        _cache_verified_project(pid)
+    return unverified - found
+
+
+def invalidate_project(project_id: str) -> None:
+    """
+    Evict a project id from the existence cache.
+
+    Called when a project is deleted so stale hits cannot outlive it
+    past the TTL.
+
+    Args:
+        project_id: Project ID to evict
+    """
+    _verified_projects.pop(project_id, None)
+
@@ -6,12 +6,13 @@ error messages and proper HTTP status codes.
 """
 
 import logging
+import time
 import traceback
 from typing import Any, Dict, List, Optional, Union
 
 from fastapi import HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, ValidationError
 from sqlalchemy.exc import (
     IntegrityError,
@@ -21,6 +22,22 @@ from sqlalchemy.exc import (
 
 logger = logging.getLogger(__name__)
 
+# Error-response timestamps only need second resolution, so the ISO
+# string is formatted once per second instead of allocating a datetime
+# per error — bursts of validation failures share one strftime call
+_last_ts_sec = 0
+_last_ts_str = ""
+
+
+def _iso_now() -> str:
+    """Return the current UTC time as an ISO string, cached per second."""
+    global _last_ts_sec, _last_ts_str
+    s = int(time.time())
+    if s != _last_ts_sec:
+        _last_ts_sec = s
+        _last_ts_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(s))
+    return _last_ts_str
+
 
 class ErrorDetail(BaseModel):
     """Detailed error information."""
@@ -203,18 +220,21 @@ def create_error_response(
     Returns:
         JSONResponse with error information
     """
-    from datetime import datetime
-    
-    response = ErrorResponse(
-        error=error,
-        details=details,
-        request_id=request_id,
-        timestamp=datetime.utcnow().isoformat()
-    )
-    
-    return JSONResponse(
+    # Build the envelope dict directly: the shape is fixed by
+    # ErrorResponse, and skipping the model construct + model_dump
+    # round trip keeps error floods (validation spam, 4xx bursts) cheap
+    content = {
+        "error": error,
+        "details": [d.model_dump() for d in details],
+        "request_id": request_id,
+        "timestamp": _iso_now(),
+    }
+
+    # Error responses bypass default_response_class, so serialize them
+    # through orjson explicitly to match the rest of the app
+    return ORJSONResponse(
         status_code=status_code,
-        content=response.model_dump()
+        content=content
     )
 
 
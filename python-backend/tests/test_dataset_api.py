@@ -4,12 +4,15 @@ Tests for dataset API endpoints.
 This module tests the dataset CRUD operations via the API.
 """
 
+from pathlib import Path
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from easy_dataset.database.base import Base
+from easy_dataset.database.connection import _enable_foreign_keys
 # Import all models to ensure they're registered with Base BEFORE creating tables
 from easy_dataset.models import (
     Projects, Datasets, Chunks, Questions, UploadFiles, Tags,
@@ -26,6 +29,9 @@ SQLALCHEMY_DATABASE_URL = "sqlite:///./test_dataset_api.db"
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
+# Enforce foreign keys like the application engine does; the API relies
+# on FK violations to detect missing parent rows
+event.listen(engine, "connect", _enable_foreign_keys)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create tables after models are imported
@@ -130,7 +136,8 @@ def test_create_dataset_invalid_project():
     )
     
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
+    # The error middleware wraps HTTPException details in its envelope
+    assert "not found" in response.json()["details"][0]["message"].lower()
 
 
 def test_list_datasets(test_project):
@@ -339,6 +346,162 @@ def test_delete_dataset_not_found():
     assert response.status_code == 404
 
 
+@pytest.fixture
+def test_chunk(test_project):
+    """Create a chunk to attach questions to."""
+    response = client.post(
+        "/api/chunks/bulk",
+        json=[
+            {
+                "project_id": test_project["id"],
+                "file_id": "file_1",
+                "file_name": "doc.txt",
+                "name": "doc.txt-part-1",
+                "content": "France is a country in Europe.",
+            }
+        ],
+    )
+    assert response.status_code == 201
+    return response.json()[0]
+
+
+def test_create_chunks_bulk(test_project):
+    """Test bulk-creating chunks and reading them back."""
+    payload = [
+        {
+            "project_id": test_project["id"],
+            "file_id": "file_1",
+            "file_name": "doc.txt",
+            "name": f"doc.txt-part-{i}",
+            "content": f"Chunk content {i}.",
+        }
+        for i in range(3)
+    ]
+    response = client.post("/api/chunks/bulk", json=payload)
+
+    assert response.status_code == 201
+    data = response.json()
+    assert len(data) == 3
+    assert [c["name"] for c in data] == [p["name"] for p in payload]
+    # Size defaults to the content length when omitted
+    assert all(c["size"] == len(p["content"]) for c, p in zip(data, payload))
+    assert all("id" in c and "create_at" in c for c in data)
+
+    # Round trip: the chunks are listable under the project
+    response = client.get(f"/api/chunks?project_id={test_project['id']}")
+    assert response.status_code == 200
+    listed = response.json()
+    assert {c["name"] for c in listed} == {p["name"] for p in payload}
+
+
+def test_create_chunks_bulk_unknown_project():
+    """Test bulk chunk creation against a non-existent project."""
+    response = client.post(
+        "/api/chunks/bulk",
+        json=[
+            {
+                "project_id": "invalid_project_id",
+                "file_id": "file_1",
+                "file_name": "doc.txt",
+                "name": "doc.txt-part-1",
+                "content": "Chunk content.",
+            }
+        ],
+    )
+    assert response.status_code == 404
+    assert "invalid_project_id" in response.json()["details"][0]["message"]
+
+    # Nothing was inserted
+    response = client.get("/api/chunks")
+    assert response.json() == []
+
+
+def test_create_questions_batch(test_project, test_chunk):
+    """Test creating several questions in one request."""
+    payload = [
+        {
+            "project_id": test_project["id"],
+            "chunk_id": test_chunk["id"],
+            "question": f"Question {i}?",
+            "label": "test",
+        }
+        for i in range(3)
+    ]
+    response = client.post("/api/questions/batch", json=payload)
+
+    assert response.status_code == 201
+    data = response.json()
+    assert len(data) == 3
+    # Rows come back in input order with generated ids and timestamps
+    assert [q["question"] for q in data] == [p["question"] for p in payload]
+    assert all(q["chunk_id"] == test_chunk["id"] for q in data)
+    assert all("id" in q and "create_at" in q for q in data)
+
+    # The questions are persisted and listable
+    response = client.get(f"/api/questions?project_id={test_project['id']}")
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+
+
+def test_create_questions_batch_unknown_chunk(test_project, test_chunk):
+    """Test that one bad chunk reference rejects the whole batch."""
+    payload = [
+        {
+            "project_id": test_project["id"],
+            "chunk_id": test_chunk["id"],
+            "question": "Valid question?",
+            "label": "test",
+        },
+        {
+            "project_id": test_project["id"],
+            "chunk_id": "missing_chunk_id",
+            "question": "Orphan question?",
+            "label": "test",
+        },
+    ]
+    response = client.post("/api/questions/batch", json=payload)
+
+    assert response.status_code == 404
+    assert "missing_chunk_id" in response.json()["details"][0]["message"]
+
+    # Nothing from the mixed batch was inserted
+    response = client.get(f"/api/questions?project_id={test_project['id']}")
+    assert response.json() == []
+
+
+def test_create_questions_batch_unknown_project(test_chunk):
+    """Test creating a batch against a non-existent project."""
+    response = client.post(
+        "/api/questions/batch",
+        json=[
+            {
+                "project_id": "invalid_project_id",
+                "chunk_id": test_chunk["id"],
+                "question": "Question?",
+                "label": "test",
+            }
+        ],
+    )
+    assert response.status_code == 404
+    assert "invalid_project_id" in response.json()["details"][0]["message"]
+
+
+def test_create_question_unknown_ga_pair(test_project, test_chunk):
+    """Test the IntegrityError fallback labeling for GA pair references."""
+    response = client.post(
+        "/api/questions",
+        json={
+            "project_id": test_project["id"],
+            "chunk_id": test_chunk["id"],
+            "question": "Question?",
+            "label": "test",
+            "ga_pair_id": "missing_ga_pair",
+        },
+    )
+    assert response.status_code == 404
+    assert "GA pair" in response.json()["details"][0]["message"]
+
+
 def test_dataset_pagination(test_project):
     """Test dataset pagination."""
     # Create 10 dataset entries
@@ -368,3 +531,133 @@ def test_dataset_pagination(test_project):
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 5
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    """Redirect upload storage to a per-test directory."""
+    from easy_dataset_server.api import files
+    from easy_dataset_server.config import settings
+
+    monkeypatch.setattr(settings, "upload_dir", str(tmp_path))
+    # The module caches created directories; stale entries from other
+    # tests would skip the mkdir for this test's fresh tree
+    files._ensured_dirs.clear()
+    yield tmp_path
+    files._ensured_dirs.clear()
+
+
+def _upload(project_id, filename, content):
+    """Upload a file and return the response."""
+    return client.post(
+        "/api/files/upload",
+        data={"project_id": project_id},
+        files={"file": (filename, content, "text/plain")},
+    )
+
+
+def test_upload_file_deduplicates_content(test_project, upload_dir):
+    """Test that re-uploading identical content stores one blob."""
+    content = b"Shared file content."
+
+    first = _upload(test_project["id"], "a.txt", content)
+    second = _upload(test_project["id"], "b.txt", content)
+    assert first.status_code == 201
+    assert second.status_code == 201
+
+    data_a, data_b = first.json(), second.json()
+    assert data_a["md5"] == data_b["md5"]
+    assert data_a["path"] == data_b["path"]
+    assert data_a["file_name"] == "a.txt"
+    assert data_b["file_name"] == "b.txt"
+
+    # Exactly one blob on disk (temp files cleaned up, duplicate dropped)
+    blobs = [p for p in upload_dir.rglob("*") if p.is_file()]
+    assert len(blobs) == 1
+    assert blobs[0].read_bytes() == content
+
+
+def test_upload_file_sanitizes_filename(test_project, upload_dir):
+    """Test that directory components in the filename are dropped."""
+    response = _upload(test_project["id"], "../../evil.txt", b"payload")
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["file_name"] == "evil.txt"
+    assert data["file_ext"] == ".txt"
+
+    # The blob lives under the project's upload directory; nothing
+    # escaped to the parent directories
+    project_dir = upload_dir / test_project["id"]
+    stored = Path(data["path"]).resolve()
+    assert project_dir.resolve() in stored.parents
+    assert not (upload_dir.parent / "evil.txt").exists()
+
+
+def test_delete_file_keeps_shared_blob(test_project, upload_dir):
+    """Test that deleting one of two records sharing a blob keeps it."""
+    content = b"Blob referenced twice."
+    first = _upload(test_project["id"], "a.txt", content).json()
+    second = _upload(test_project["id"], "b.txt", content).json()
+    blob = Path(first["path"])
+    assert blob.exists()
+
+    # First delete: the other record still references the blob
+    response = client.delete(f"/api/files/{first['id']}")
+    assert response.status_code == 204
+    assert blob.exists()
+
+    # Second delete: last reference gone, blob removed
+    response = client.delete(f"/api/files/{second['id']}")
+    assert response.status_code == 204
+    assert not blob.exists()
+
+
+def test_dataset_cursor_pagination_to_exhaustion(test_project):
+    """Test that cursor paging visits every row exactly once."""
+    created_ids = set()
+    for i in range(10):
+        response = client.post(
+            "/api/datasets",
+            json={
+                "project_id": test_project["id"],
+                "question_id": f"question_{i}",
+                "question": f"Question {i}?",
+                "answer": f"Answer {i}.",
+                "chunk_name": f"Chunk {i}",
+                "chunk_content": f"Content {i}.",
+                "model": "gpt-4",
+                "question_label": "test",
+            }
+        )
+        created_ids.add(response.json()["id"])
+
+    # Follow X-Next-Cursor from the first page (cursor="") until a short
+    # page; each row must appear exactly once across all pages
+    seen_ids = []
+    cursor = ""
+    while True:
+        response = client.get(f"/api/datasets?limit=3&cursor={cursor}")
+        assert response.status_code == 200
+        page = response.json()
+        seen_ids.extend(item["id"] for item in page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            assert len(page) < 3
+            break
+
+    assert len(seen_ids) == len(set(seen_ids))  # no duplicates
+    assert set(seen_ids) == created_ids  # no omissions
+
+
+def test_dataset_pagination_malformed_cursor():
+    """Test that an undecodable cursor is rejected with 400."""
+    response = client.get("/api/datasets?cursor=notbase64!!")
+    assert response.status_code == 400
+    assert "cursor" in response.json()["details"][0]["message"]
+
+    # The projects listing goes through the shared paginated-response
+    # helper and must reject it the same way
+    response = client.get("/api/projects?cursor=notbase64!!")
+    assert response.status_code == 400
+    assert "cursor" in response.json()["details"][0]["message"]